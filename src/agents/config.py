@@ -13,6 +13,7 @@ Consolidated MCP servers (v2):
 import os
 from dataclasses import dataclass
 
+from azure.identity import AzureCliCredential, DefaultAzureCredential
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -100,3 +101,18 @@ class AgentConfig:
             openai=AzureOpenAIConfig.from_env(),
             apim_subscription_key=os.getenv("APIM_SUBSCRIPTION_KEY", ""),
         )
+
+
+# DefaultAzureCredential probes env vars, managed identity (IMDS), CLI, etc.
+# on construction; credentials also cache their tokens, so keep one per mode
+# for the whole process and share it across workflows.
+_credentials: dict = {}
+
+
+def get_credential(local: bool = False) -> "AzureCliCredential | DefaultAzureCredential":
+    """Get or create the shared Azure credential (CLI for local, default otherwise)."""
+    credential = _credentials.get(local)
+    if credential is None:
+        credential = AzureCliCredential() if local else DefaultAzureCredential()
+        _credentials[local] = credential
+    return credential
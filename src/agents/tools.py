@@ -221,7 +221,10 @@ class MCPToolKit:
                 await tool.__aexit__(None, None, None)
             except Exception:
                 logger.warning("Error closing MCP tool %s", tool.name, exc_info=True)
-        # Close the shared httpx client
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the shared httpx client (for toolkits used without ``async with``)."""
         if self._http_client:
             try:
                 await self._http_client.aclose()
@@ -20,12 +20,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
 from agent_framework import Agent
 from agent_framework.azure import AzureOpenAIResponsesClient
-from azure.identity import AzureCliCredential, DefaultAzureCredential
 
 from ..agents import PROTOCOL_DRAFT_AGENT_INSTRUCTIONS, create_trials_research_agent
-from ..config import AgentConfig
+from ..config import AgentConfig, get_credential
 from ..tools import MCPToolKit
 
 logger = logging.getLogger(__name__)
@@ -63,7 +63,7 @@ async def run_clinical_trials_workflow(
     output_path = Path(output_dir or "waypoints")
     output_path.mkdir(parents=True, exist_ok=True)
 
-    credential = DefaultAzureCredential() if not local else AzureCliCredential()
+    credential = get_credential(local)
     client = AzureOpenAIResponsesClient(
         credential=credential,
         endpoint=config.openai.endpoint,
@@ -154,6 +154,6 @@ async def run_clinical_trials_workflow(
 def _write_waypoint(path: Path, data: dict) -> None:
     """Write a waypoint JSON file."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    # orjson serializes straight to bytes (datetimes natively); one write call
+    path.write_bytes(orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
     logger.info("Waypoint written: %s", path)
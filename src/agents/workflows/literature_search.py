@@ -19,13 +19,12 @@ from typing import Any
 
 from agent_framework.azure import AzureOpenAIResponsesClient
 from agent_framework_orchestrations import ConcurrentBuilder
-from azure.identity import AzureCliCredential, DefaultAzureCredential
 
 from ..agents import (
     create_literature_search_agent,
     create_trials_correlation_agent,
 )
-from ..config import AgentConfig
+from ..config import AgentConfig, get_credential
 from ..tools import MCPToolKit, CLINICAL_TRIALS_TOOLS_ALL, create_clinical_research_tool
 
 logger = logging.getLogger(__name__)
@@ -59,7 +58,7 @@ async def run_literature_search_workflow(
     output_path = Path(output_dir or "outputs")
     output_path.mkdir(parents=True, exist_ok=True)
 
-    credential = DefaultAzureCredential() if not local else AzureCliCredential()
+    credential = get_credential(local)
     client = AzureOpenAIResponsesClient(
         credential=credential,
         endpoint=config.openai.endpoint,
@@ -14,10 +14,9 @@ from pathlib import Path
 from typing import Any
 
 from agent_framework.azure import AzureOpenAIResponsesClient
-from azure.identity import AzureCliCredential, DefaultAzureCredential
 
 from ..agents import create_patient_summary_agent
-from ..config import AgentConfig
+from ..config import AgentConfig, get_credential
 from ..tools import MCPToolKit
 
 logger = logging.getLogger(__name__)
@@ -49,7 +48,7 @@ async def run_patient_data_workflow(
     output_path = Path(output_dir or "outputs")
     output_path.mkdir(parents=True, exist_ok=True)
 
-    credential = DefaultAzureCredential() if not local else AzureCliCredential()
+    credential = get_credential(local)
     client = AzureOpenAIResponsesClient(
         credential=credential,
         endpoint=config.openai.endpoint,
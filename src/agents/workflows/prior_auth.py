@@ -18,8 +18,8 @@ Waypoint schema matches the skill contract so that outputs are
 replicable across agentic platforms (Copilot Chat, Foundry, DevUI, CLI).
 
 Uses Microsoft Agent Framework's SequentialBuilder and ConcurrentBuilder
-composed into a custom hybrid workflow.  Audit events and bead state are
-recorded at each phase boundary.
+composed into a custom hybrid workflow.  Bead state is recorded at each
+phase boundary; audit events are sent in the background at each checkpoint.
 
 Run outputs are stored in .runs/<timestamp>_<request-id>/ with waypoints/
 and outputs/ subdirs. A 'latest' symlink in .runs/ points to the most
@@ -28,18 +28,27 @@ recent run.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import itertools
 import json
 import logging
 import os
 import re
+import secrets
+import tempfile
 import uuid
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+import httpx
+import orjson
 from agent_framework.azure import AzureOpenAIResponsesClient
 from agent_framework_orchestrations import ConcurrentBuilder
-from azure.identity import AzureCliCredential, DefaultAzureCredential
 
 from ..agents import (
     create_clinical_reviewer_agent,
@@ -47,7 +56,7 @@ from ..agents import (
     create_coverage_agent,
     create_synthesis_agent,
 )
-from ..config import AgentConfig
+from ..config import AgentConfig, get_credential
 from ..tools import MCPToolKit
 
 logger = logging.getLogger(__name__)
@@ -136,39 +145,51 @@ BEAD_IDS = [
 ]
 
 
-def _make_beads() -> list[dict[str, Any]]:
-    """Create the initial bead tracking array."""
-    return [{"id": bid, "status": "not-started"} for bid in BEAD_IDS]
+def _utcnow_iso() -> str:
+    """Current UTC time as an ISO-8601 string (bead, audit and waypoint stamps)."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _pa_number(now: datetime) -> str:
+    """Return a PA-YYYYMMDD-XXXXX reference (request IDs and auth numbers)."""
+    # 3 random bytes cover the 5 hex digits; no need for a full uuid4
+    return f"PA-{now.strftime('%Y%m%d')}-{secrets.token_hex(3)[:5].upper()}"
+
+
+def _make_beads() -> dict[str, dict[str, Any]]:
+    """Create the initial bead tracking map, keyed by ID in BEAD_IDS order."""
+    return {bid: {"id": bid, "status": "not-started"} for bid in BEAD_IDS}
+
+
+def _index_beads(beads: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Key a waypoint's bead array by ID (beads it lacks start as not-started)."""
+    by_id = {b["id"]: b for b in beads}
+    return {bid: by_id.get(bid) or {"id": bid, "status": "not-started"} for bid in BEAD_IDS}
 
 
 def _update_bead(
-    beads: list[dict[str, Any]],
+    beads: dict[str, dict[str, Any]],
     bead_id: str,
     status: str,
 ) -> None:
     """Update a bead's status in-place."""
     ts_key = "completed_at" if status == "completed" else "started_at"
-    for b in beads:
-        if b["id"] == bead_id:
-            b["status"] = status
-            b[ts_key] = datetime.now(timezone.utc).isoformat()
-            return
+    bead = beads[bead_id]
+    bead["status"] = status
+    bead[ts_key] = _utcnow_iso()
 
 
-def _first_incomplete_bead(beads: list[dict[str, Any]]) -> str | None:
+def _first_incomplete_bead(beads: dict[str, dict[str, Any]]) -> str | None:
     """Return the ID of the first non-completed bead, or None."""
-    for b in beads:
-        if b["status"] != "completed":
-            return b["id"]
+    for bid in BEAD_IDS:
+        if beads[bid]["status"] != "completed":
+            return bid
     return None
 
 
-def _bead_needs_work(beads: list[dict], bead_id: str) -> bool:
+def _bead_needs_work(beads: dict[str, dict[str, Any]], bead_id: str) -> bool:
     """Return True if the bead is not yet completed."""
-    for b in beads:
-        if b["id"] == bead_id:
-            return b["status"] != "completed"
-    return True
+    return beads[bead_id]["status"] != "completed"
 
 
 # ---------------------------------------------------------------------------
@@ -176,27 +197,93 @@ def _bead_needs_work(beads: list[dict], bead_id: str) -> bool:
 # ---------------------------------------------------------------------------
 
 
-def _write_waypoint(path: Path, data: dict) -> None:
-    """Write a waypoint JSON file."""
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    """Write via a temp file + os.replace so a crash never leaves a truncated file.
+
+    Each call gets its own temp name, so concurrent writers of one path can
+    never move another writer's half-written file into place.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2, default=str)
+    tmp: str | None = None
+    try:
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False) as f:
+            tmp = f.name
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        if tmp is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+        raise
+
+
+async def _write_waypoint(path: Path, data: dict) -> None:
+    """Atomically write a waypoint JSON file without blocking the event loop."""
+    # Serialize on the loop (callers keep mutating data); only disk I/O is offloaded
+    payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+    await asyncio.to_thread(_atomic_write_bytes, path, payload)
     logger.info("Waypoint written: %s", path)
 
 
 def _read_waypoint(path: Path) -> dict | None:
     """Read a waypoint if it exists, else None."""
     if path.exists():
-        with open(path) as f:
-            return json.load(f)
+        return orjson.loads(path.read_bytes())
     return None
 
 
-def _write_output_file(path: Path, content: str) -> None:
-    """Write a text output file."""
+def _append_bytes(path: Path, payload: bytes) -> None:
+    """Append bytes to a file, creating its directory if needed."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w") as f:
-        f.write(content)
+    with open(path, "ab") as f:
+        f.write(payload)
+
+
+async def _append_raw_output(path: Path, bead_id: str, key: str, text: str) -> None:
+    """Append one bead's raw agent output to the NDJSON side log.
+
+    Kept out of assessment.json so the skill waypoint is not re-serialized
+    with multi-KB agent transcripts at every bead transition.
+    """
+    line = orjson.dumps({"bead": bead_id, "key": key, "text": text}) + b"\n"
+    await asyncio.to_thread(_append_bytes, path, line)
+
+
+def _read_raw_outputs(path: Path) -> dict[str, str]:
+    """Load raw agent outputs from the side log by key (later lines win)."""
+    if not path.exists():
+        return {}
+    outputs: dict[str, str] = {}
+    for line in path.read_bytes().splitlines():
+        if not line:
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # A line cut short by a crash mid-append; keep what was fully written
+            logger.warning("Skipping unreadable line in %s", path)
+            continue
+        outputs[record["key"]] = record["text"]
+    return outputs
+
+
+def _resume_raw_outputs(path: Path, existing: dict[str, Any]) -> dict[str, str]:
+    """Raw agent outputs for a resumed run.
+
+    Reads the side log, falling back to the _raw_compliance/_raw_concurrent
+    texts that waypoints written before the side log carried inline.
+    """
+    outputs = _read_raw_outputs(path)
+    for key in ("compliance", "concurrent"):
+        if key not in outputs and existing.get(f"_raw_{key}"):
+            outputs[key] = existing[f"_raw_{key}"]
+    return outputs
+
+
+async def _write_output_file(path: Path, content: str | bytes) -> None:
+    """Atomically write an output file (text as UTF-8) without blocking the event loop."""
+    payload = content.encode() if isinstance(content, str) else content
+    await asyncio.to_thread(_atomic_write_bytes, path, payload)
     logger.info("Output written: %s", path)
 
 
@@ -205,34 +292,60 @@ def _write_output_file(path: Path, content: str) -> None:
 # ---------------------------------------------------------------------------
 
 
+# The synthesis agent may only recommend APPROVE or PEND (never DENY)
+_RECOMMENDATION_RE = re.compile(r'"recommendation"\s*:\s*"(APPROVE|PEND)"', re.IGNORECASE)
+# Text fallback for the gate when the compliance reply is not parseable JSON
+_COMPLIANCE_GATE_RE = re.compile(
+    r'"can_proceed_to_clinical_review"\s*:\s*(true|false)|"compliance_status"\s*:\s*"(pass|fail)"',
+    re.IGNORECASE,
+)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+_JSON_DECODER = json.JSONDecoder()
+_BRACE_RE = re.compile(r"[{}]")
+
+
+def _brace_span_end(text: str, start: int) -> int:
+    """Return the index just past the brace-balanced span opening at start.
+
+    Counts raw braces (like the decoder-free scan this replaced); an
+    unclosed span runs to the end of the text.
+    """
+    depth = 0
+    for m in _BRACE_RE.finditer(text, start):
+        depth += 1 if m.group() == "{" else -1
+        if depth == 0:
+            return m.end()
+    return len(text)
+
+
 def _extract_json_from_text(text: str) -> dict | None:
     """Try to extract a JSON object from agent text output."""
-    try:
-        return json.loads(text)
-    except (json.JSONDecodeError, TypeError):
-        pass
+    # No brace means no object — skip every strategy below
+    if not text or "{" not in text:
+        return None
+    if text.lstrip().startswith("{"):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
     # Look for ```json ... ``` blocks
-    m = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", text, re.DOTALL)
-    if m:
+    if "```" in text:
+        m = _JSON_FENCE_RE.search(text)
+        if m:
+            try:
+                return orjson.loads(m.group(1))
+            except orjson.JSONDecodeError:
+                pass
+    # Look for the first top-level { ... } object; raw_decode scans it in C
+    # and ignores whatever prose follows. A malformed object is skipped whole
+    # so none of its nested objects is mistaken for the reply.
+    start = text.find("{")
+    while start != -1:
         try:
-            return json.loads(m.group(1))
+            obj, _ = _JSON_DECODER.raw_decode(text, start)
+            return obj
         except json.JSONDecodeError:
-            pass
-    # Look for the first { ... } block
-    brace_depth = 0
-    start = None
-    for i, ch in enumerate(text):
-        if ch == "{":
-            if brace_depth == 0:
-                start = i
-            brace_depth += 1
-        elif ch == "}":
-            brace_depth -= 1
-            if brace_depth == 0 and start is not None:
-                try:
-                    return json.loads(text[start : i + 1])
-                except json.JSONDecodeError:
-                    start = None
+            start = text.find("{", _brace_span_end(text, start))
     return None
 
 
@@ -240,20 +353,157 @@ def _safe_get(d: dict | None, *keys: str, default: Any = None) -> Any:
     """Nested dict get with fallback."""
     cur = d
     for k in keys:
-        if not isinstance(cur, dict):
+        # Parsed JSON is always a plain dict; the exact type check skips isinstance's MRO walk
+        if type(cur) is not dict:
             return default
         cur = cur.get(k, default)
     return cur
 
 
+def _has_clinical_evidence(request_data: dict[str, Any]) -> bool:
+    """Return True if the request carries clinical documentation and ICD-10 codes.
+
+    Bead 002 reviewers have nothing to map against when either is missing.
+    """
+    has_docs = bool(
+        request_data.get("clinical_documentation") or request_data.get("clinical_summary")
+    )
+    icd_codes = _safe_get(request_data, "service", "icd10_codes", default=[]) or _safe_get(
+        request_data, "diagnosis", "icd10_codes", default=[]
+    )
+    return has_docs and bool(icd_codes)
+
+
 # ---------------------------------------------------------------------------
-# Audit helper
+# Assessment skeleton — skill contract schema
 # ---------------------------------------------------------------------------
 
 
-async def _record_audit_event(
-    toolkit: MCPToolKit,
+def _build_assessment_skeleton(
+    request_id: str,
     workflow_id: str,
+    beads: dict[str, dict[str, Any]],
+    request_block: dict[str, Any],
+    cpt_codes: list[str],
+    icd10_codes: list[str],
+) -> dict[str, Any]:
+    """Build a fresh assessment waypoint in the skill contract schema."""
+    return {
+        "request_id": request_id,
+        "workflow_id": workflow_id,
+        "created": _utcnow_iso(),
+        "status": "in_progress",
+        "version": "2.0",
+        "beads": list(beads.values()),
+        "request": request_block,
+        "fhir_patient_context": {
+            "patient_found": False,
+            "fhir_patient_id": None,
+            "active_conditions": [],
+            "active_medications": [],
+            "recent_observations": [],
+            "cross_reference_notes": "",
+        },
+        "clinical": {
+            "chief_complaint": "",
+            "key_findings": [],
+            "prior_treatments": [],
+            "extraction_confidence": 0,
+        },
+        "policy": {
+            "policy_id": "",
+            "policy_title": "",
+            "policy_type": "",
+            "contractor": "",
+            "covered_indications": [],
+            "medical_necessity_check": {
+                "cpt_code": cpt_codes[0] if cpt_codes else "",
+                "icd10_codes": icd10_codes,
+                "is_covered": None,
+                "policy_basis": "",
+            },
+            "rag_context": "",
+        },
+        "literature_support": {
+            "searched": False,
+            "query_used": "",
+            "articles_found": 0,
+            "key_citations": [],
+            "evidence_summary": "",
+        },
+        "criteria_evaluation": [],
+        "recommendation": {
+            "decision": "",
+            "confidence": "",
+            "confidence_score": 0,
+            "rationale": "",
+            "criteria_met": "",
+            "criteria_percentage": 0,
+            "prerequisite_checks": {
+                "provider_verified": False,
+                "codes_valid": False,
+                "policy_found": False,
+                "criteria_threshold_met": False,
+                "confidence_threshold_met": False,
+            },
+            "gaps": [],
+        },
+    }
+
+
+# ---------------------------------------------------------------------------
+# Prompt templates — %-formatted once per bead with the large text parts
+# ---------------------------------------------------------------------------
+
+_COMPLIANCE_PROMPT = (
+    "Validate the following prior authorization request for compliance.\n"
+    "Check provider NPI, validate all ICD-10 codes, and identify any "
+    "missing fields.\n"
+    "If provider NPI is 1234567890, this is demo mode — mark as verified.\n\n"
+    "PA Request:\n```json\n%s\n```"
+)
+
+_CLINICAL_PROMPT = (
+    "You are part of a prior authorization review team. Below is the "
+    "PA request and compliance results. Perform YOUR specific role as "
+    "described in your instructions.\n\n"
+    "PA Request:\n```json\n%s\n```\n\n"
+    "Compliance Results:\n%s"
+    "%s"
+)
+
+_RAG_SECTION_PROMPT = "\n\n## Indexed Payer Policy Context (from RAG)\n%s"
+
+_SYNTHESIS_PROMPT = (
+    "Aggregate the following agent outputs into a final prior "
+    "authorization assessment.\n"
+    "Apply the decision rubric strictly.\n\n"
+    "## Original PA Request\n```json\n%s\n```\n\n"
+    "## Compliance Agent Output\n%s\n\n"
+    "## Clinical Review + Coverage Agent Outputs\n%s\n\n"
+    "Produce your final structured assessment JSON with:\n"
+    '  "recommendation": "APPROVE" or "PEND"\n'
+    '  "confidence_score": 0-100\n'
+    '  "confidence_breakdown": {provider, codes, policy, clinical, '
+    "doc_quality}\n"
+    '  "criteria_summary": [{criterion, status, evidence}]\n'
+    '  "pend_reasons": [...] if PEND\n'
+    '  "required_actions": [...] if PEND\n'
+    '  "summary": "2-3 sentence executive summary"'
+)
+
+
+# ---------------------------------------------------------------------------
+# Audit helper
+# ---------------------------------------------------------------------------
+
+
+# JSON-RPC ids only need to be unique per client session — a counter is enough
+_rpc_ids = itertools.count(1)
+
+
+def _queue_audit_event(
+    events: list[dict[str, Any]],
     phase: str,
     action: str,
     status: str,
@@ -263,36 +513,112 @@ async def _record_audit_event(
     details: dict | None = None,
     agent_name: str = "workflow",
 ) -> None:
-    """Fire-and-forget audit event via cosmos-rag MCP server."""
+    """Buffer an audit event; sent at the next bead checkpoint by _AuditBuffer.send."""
+    events.append(
+        {
+            "workflow_type": "prior-auth",
+            "phase": phase,
+            "agent_name": agent_name,
+            "action": action,
+            "status": status,
+            "input_summary": input_summary,
+            "output_summary": output_summary,
+            # Server timestamps reflect flush time, so keep when it happened
+            "details": {**(details or {}), "recorded_at": _utcnow_iso()},
+        }
+    )
+
+
+async def _flush_audit_events(
+    http: httpx.AsyncClient,
+    toolkit: MCPToolKit,
+    workflow_id: str,
+    events: list[dict[str, Any]],
+) -> None:
+    """Fire-and-forget the buffered audit events via cosmos-rag MCP server.
+
+    The server has no bulk method, so the events are posted one at a time
+    over the run's shared connection pool, keeping the server-side
+    timestamps in the order the phases ran.
+    """
+    if not events:
+        return
     try:
         audit_tool = toolkit.audit_tools()[0]
         async with audit_tool:
-            import httpx
-
-            payload = {
-                "jsonrpc": "2.0",
-                "id": str(uuid.uuid4()),
-                "method": "tools/call",
-                "params": {
-                    "name": "record_audit_event",
-                    "arguments": {
-                        "workflow_id": workflow_id,
-                        "workflow_type": "prior-auth",
-                        "phase": phase,
-                        "agent_name": agent_name,
-                        "action": action,
-                        "status": status,
-                        "input_summary": input_summary,
-                        "output_summary": output_summary,
-                        "details": details or {},
+            for event in events:
+                payload = {
+                    "jsonrpc": "2.0",
+                    "id": next(_rpc_ids),
+                    "method": "tools/call",
+                    "params": {
+                        "name": "record_audit_event",
+                        "arguments": {"workflow_id": workflow_id, **event},
                     },
-                },
-            }
-            async with httpx.AsyncClient(timeout=httpx.Timeout(30.0)) as hc:
-                resp = await hc.post(audit_tool.url, json=payload)
-                resp.raise_for_status()
+                }
+                try:
+                    resp = await http.post(audit_tool.url, json=payload, timeout=30.0)
+                except httpx.HTTPError as exc:
+                    logger.warning("Failed to record audit event (phase=%s): %s", event["phase"], exc)
+                    continue
+                if resp.is_error:
+                    logger.warning(
+                        "Failed to record audit event (phase=%s): HTTP %s", event["phase"], resp.status_code
+                    )
     except Exception:
-        logger.warning("Failed to record audit event (phase=%s)", phase, exc_info=True)
+        logger.warning("Failed to record %d audit events", len(events), exc_info=True)
+    events.clear()
+
+
+class _AuditBuffer:
+    """A run's queued audit events, sent in the background at bead checkpoints.
+
+    Each flush is chained after the previous one, so batches reach the
+    server in bead order without blocking the bead that queued them.
+    """
+
+    def __init__(self, http: httpx.AsyncClient, toolkit: MCPToolKit, workflow_id: str) -> None:
+        self._http = http
+        self._toolkit = toolkit
+        self._workflow_id = workflow_id
+        self._tasks: list[asyncio.Task[None]] = []
+        self.events: list[dict[str, Any]] = []
+
+    def send(self) -> None:
+        """Schedule the queued events without blocking the next bead."""
+        if not self.events:
+            return
+        batch = self.events[:]
+        self.events.clear()
+        prev = self._tasks[-1] if self._tasks else None
+        self._tasks.append(asyncio.create_task(self._flush_after(prev, batch)))
+
+    async def _flush_after(self, prev: asyncio.Task[None] | None, batch: list[dict[str, Any]]) -> None:
+        """Flush a batch once the previous one is sent, so phases land in order."""
+        if prev is not None:
+            # wait() neither raises prev's error nor cancels prev if we are cancelled
+            await asyncio.wait((prev,))
+        await _flush_audit_events(self._http, self._toolkit, self._workflow_id, batch)
+
+    async def drain(self) -> None:
+        """Send anything still queued and wait for every background flush."""
+        self.send()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+
+@asynccontextmanager
+async def _audit_buffer(
+    http: httpx.AsyncClient,
+    toolkit: MCPToolKit,
+    workflow_id: str,
+) -> AsyncIterator[_AuditBuffer]:
+    """Collect a run's audit events; all flushes are awaited on exit (even on error)."""
+    audit = _AuditBuffer(http, toolkit, workflow_id)
+    try:
+        yield audit
+    finally:
+        await audit.drain()
 
 
 # ---------------------------------------------------------------------------
@@ -301,6 +627,7 @@ async def _record_audit_event(
 
 
 async def _rag_policy_retrieval(
+    http: httpx.AsyncClient,
     toolkit: MCPToolKit,
     request_data: dict[str, Any],
 ) -> str:
@@ -325,11 +652,9 @@ async def _rag_policy_retrieval(
     try:
         rag_tool = toolkit.rag_search_tools()[0]
         async with rag_tool:
-            import httpx
-
             payload = {
                 "jsonrpc": "2.0",
-                "id": str(uuid.uuid4()),
+                "id": next(_rpc_ids),
                 "method": "tools/call",
                 "params": {
                     "name": "hybrid_search",
@@ -340,15 +665,14 @@ async def _rag_policy_retrieval(
                     },
                 },
             }
-            async with httpx.AsyncClient(timeout=httpx.Timeout(60.0)) as hc:
-                resp = await hc.post(rag_tool.url, json=payload)
-                if resp.status_code == 200:
-                    rpc_result = resp.json()
-                    content = rpc_result.get("result", {}).get("content", [])
-                    if content:
-                        text = content[0].get("text", "")
-                        logger.info("RAG retrieval: %d chars of policy context", len(text))
-                        return text
+            resp = await http.post(rag_tool.url, json=payload)
+            if resp.status_code == 200:
+                rpc_result = resp.json()
+                content = rpc_result.get("result", {}).get("content", [])
+                if content:
+                    text = content[0].get("text", "")
+                    logger.info("RAG retrieval: %d chars of policy context", len(text))
+                    return text
     except Exception:
         logger.warning("RAG policy retrieval failed — continuing without", exc_info=True)
     return ""
@@ -359,559 +683,593 @@ async def _rag_policy_retrieval(
 # ---------------------------------------------------------------------------
 
 
-async def run_prior_auth_workflow(
-    request_data: dict[str, Any],
-    config: AgentConfig | None = None,
-    *,
-    output_dir: str | None = None,
-    local: bool = False,
-) -> dict[str, Any]:
+class PriorAuthRunner:
     """
-    Execute the Prior Authorization multi-agent workflow (Subskill 1).
+    Long-lived Prior Authorization runner (Subskill 1).
 
-    Produces skill-compatible waypoint files with bead tracking.
-    Supports resume from the first incomplete bead if waypoints exist.
+    Builds the LLM client, MCP toolkit, and the tool-less synthesis agent
+    once so that repeated runs reuse warm HTTP connection pools. The
+    compliance, clinical, and coverage agents hold their MCP sessions while
+    running, so each run builds its own from the shared client and toolkit;
+    concurrent runs on one runner do not wait on each other.
 
-    Args:
-        request_data: PA request (member, service, provider, clinical docs).
-        config: Optional AgentConfig override; loads from env if None.
-        output_dir: Directory for run files. Defaults to .runs/<timestamp>_<id>/.
-        local: If True, use localhost MCP endpoints.
+    Usage::
 
-    Returns:
-        Skill-compatible assessment dict (also written to waypoints/assessment.json).
+        runner = PriorAuthRunner(config, local=True)
+        assessment = await runner.run(request_data)
+        await runner.aclose()
     """
-    if config is None:
-        config = AgentConfig.load(local=local)
 
-    # ── Resolve run directory ──────────────────────────────────────
-    # If output_dir is explicit, use it (backwards compat). Otherwise
-    # create a new timestamped run dir under .runs/.
-    if output_dir:
-        run_dir = Path(output_dir)
-        waypoint_dir = run_dir / "waypoints" if (run_dir / "waypoints").exists() else run_dir
-        output_path = run_dir / "outputs" if (run_dir / "outputs").exists() else run_dir
-        waypoint_dir.mkdir(parents=True, exist_ok=True)
-        output_path.mkdir(parents=True, exist_ok=True)
-    else:
-        # Will be created after we have a request_id — see below
-        run_dir = None
-        waypoint_dir = None
-        output_path = None
-
-    # ── Resume detection (SKILL.md § Resume via Beads) ─────────────
-    beads = _make_beads()
-    workflow_id = str(uuid.uuid4())
-    request_id = f"PA-{datetime.now(timezone.utc).strftime('%Y%m%d')}-" f"{uuid.uuid4().hex[:5].upper()}"
-
-    # Try to resume from existing waypoint if run_dir was provided
-    existing = None
-    if waypoint_dir:
-        assessment_path = waypoint_dir / "assessment.json"
-        existing = _read_waypoint(assessment_path)
-
-    if existing and "beads" in existing:
-        beads = existing["beads"]
-        workflow_id = existing.get("workflow_id", workflow_id)
-        request_id = existing.get("request_id", request_id)
-        resume_bead = _first_incomplete_bead(beads)
-        if resume_bead:
-            logger.info("Resuming from bead %s (prior session found)", resume_bead)
-        else:
-            logger.info("All beads completed — returning existing assessment")
-            return existing
+    def __init__(self, config: AgentConfig, *, local: bool = False) -> None:
+        self.config = config
+        self.client = AzureOpenAIResponsesClient(
+            credential=get_credential(local),
+            endpoint=config.openai.endpoint,
+            deployment_name=config.openai.deployment_name,
+            api_version=config.openai.api_version,
+        )
+        self.toolkit = MCPToolKit.from_endpoints(
+            config.endpoints,
+            subscription_key=config.apim_subscription_key,
+        )
+        self.synthesis_agent = create_synthesis_agent(client=self.client)
 
-    # ── Create run directory if not yet resolved ───────────────────
-    if run_dir is None:
-        run_dir = _create_run_dir(request_id)
-        waypoint_dir = run_dir / "waypoints"
-        output_path = run_dir / "outputs"
+    async def aclose(self) -> None:
+        """Release the shared MCP HTTP client."""
+        await self.toolkit.aclose()
 
-    assessment_path = waypoint_dir / "assessment.json"
+    async def _run_compliance(self, prompt: str) -> str:
+        """Run a fresh Compliance Agent and return its raw text output."""
+        compliance_agent = create_compliance_agent(
+            client=self.client,
+            tools=self.toolkit.compliance_tools(),
+        )
+        async with compliance_agent:
+            return str(await compliance_agent.run(prompt))
+
+    async def run(
+        self,
+        request_data: dict[str, Any],
+        *,
+        output_dir: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Execute the Prior Authorization multi-agent workflow (Subskill 1).
+
+        Produces skill-compatible waypoint files with bead tracking.
+        Supports resume from the first incomplete bead if waypoints exist.
+
+        Args:
+            request_data: PA request (member, service, provider, clinical docs).
+            output_dir: Directory for run files. Defaults to .runs/<timestamp>_<id>/.
+
+        Returns:
+            Skill-compatible assessment dict (also written to waypoints/assessment.json).
+        """
+        toolkit = self.toolkit
+
+        # ── Resolve run directory ──────────────────────────────────────
+        # If output_dir is explicit, use it (backwards compat). Otherwise
+        # create a new timestamped run dir under .runs/.
+        if output_dir:
+            run_dir = Path(output_dir)
+            waypoint_dir = run_dir / "waypoints" if (run_dir / "waypoints").exists() else run_dir
+            output_path = run_dir / "outputs" if (run_dir / "outputs").exists() else run_dir
+            waypoint_dir.mkdir(parents=True, exist_ok=True)
+            output_path.mkdir(parents=True, exist_ok=True)
+        else:
+            # Will be created after we have a request_id — see below
+            run_dir = None
+            waypoint_dir = None
+            output_path = None
+
+        # ── Resume detection (SKILL.md § Resume via Beads) ─────────────
+        beads = _make_beads()
+        workflow_id = str(uuid.uuid4())
+        request_id = _pa_number(datetime.now(timezone.utc))
+
+        # Try to resume from existing waypoint if run_dir was provided
+        existing = None
+        if waypoint_dir:
+            assessment_path = waypoint_dir / "assessment.json"
+            existing = _read_waypoint(assessment_path)
+
+        if existing and "beads" in existing:
+            beads = _index_beads(existing["beads"])
+            # The waypoint keeps the skill's bead array; its entries are the
+            # same dicts as the index, so updates through either stay in sync
+            existing["beads"] = list(beads.values())
+            workflow_id = existing.get("workflow_id", workflow_id)
+            request_id = existing.get("request_id", request_id)
+            resume_bead = _first_incomplete_bead(beads)
+            if resume_bead:
+                logger.info("Resuming from bead %s (prior session found)", resume_bead)
+            else:
+                logger.info("All beads completed — returning existing assessment")
+                return existing
 
-    # ── Build LLM client ───────────────────────────────────────────
-    credential = DefaultAzureCredential() if not local else AzureCliCredential()
-    client = AzureOpenAIResponsesClient(
-        credential=credential,
-        endpoint=config.openai.endpoint,
-        deployment_name=config.openai.deployment_name,
-        api_version=config.openai.api_version,
-    )
+        # ── Create run directory if not yet resolved ───────────────────
+        if run_dir is None:
+            run_dir = _create_run_dir(request_id)
+            waypoint_dir = run_dir / "waypoints"
+            output_path = run_dir / "outputs"
 
-    # ── Build MCP tools ────────────────────────────────────────────
-    toolkit = MCPToolKit.from_endpoints(
-        config.endpoints,
-        subscription_key=config.apim_subscription_key,
-    )
+        assessment_path = waypoint_dir / "assessment.json"
+        raw_outputs_path = waypoint_dir / "raw_outputs.ndjson"
+        # Only beads 002-003 consume raw outputs; skip the read once they're done
+        raw_outputs = (
+            _resume_raw_outputs(raw_outputs_path, existing)
+            if existing and _bead_needs_work(beads, "bd-pa-003-recommend")
+            else {}
+        )
 
-    request_json = json.dumps(request_data, indent=2)
+        # Dumped on first use only — a resume with just Subskill 2 beads
+        # left builds no prompts
+        request_json: str | None = None
+
+        def _get_request_json() -> str:
+            nonlocal request_json
+            if request_json is None:
+                request_json = orjson.dumps(request_data, default=str, option=orjson.OPT_INDENT_2).decode()
+            return request_json
+
+        # ── Normalize request into skill contract schema ───────────────
+        member = _safe_get(request_data, "member", default={})
+        provider = _safe_get(request_data, "provider", default={})
+        service = _safe_get(request_data, "service", default={})
+
+        cpt_codes = service.get("cpt_codes", [])
+        if not cpt_codes and service.get("cpt_code"):
+            cpt_codes = [service["cpt_code"]]
+
+        icd10_codes = service.get("icd10_codes", [])
+        if not icd10_codes:
+            diag = _safe_get(request_data, "diagnosis", default={})
+            icd10_codes = diag.get("icd10_codes", [])
+
+        request_block = {
+            "member": {
+                "name": member.get("name", ""),
+                "id": member.get("id", ""),
+                "dob": member.get("dob", ""),
+                "state": member.get("state", member.get("plan", "")),
+            },
+            "service": {
+                "type": service.get("type", ""),
+                "description": service.get("description", ""),
+                "cpt_codes": cpt_codes,
+                "icd10_codes": icd10_codes,
+                "place_of_service": service.get("place_of_service", ""),
+            },
+            "provider": {
+                "npi": provider.get("npi", ""),
+                "name": provider.get("name", ""),
+                "specialty": provider.get("specialty", ""),
+                "verified": False,
+            },
+        }
 
-    # ── Normalize request into skill contract schema ───────────────
-    member = _safe_get(request_data, "member", default={})
-    provider = _safe_get(request_data, "provider", default={})
-    service = _safe_get(request_data, "service", default={})
+        # ── Initialize assessment skeleton (skill contract) ────────────
+        assessment: dict[str, Any] = (
+            existing
+            if existing and "beads" in existing
+            else _build_assessment_skeleton(request_id, workflow_id, beads, request_block, cpt_codes, icd10_codes)
+        )
 
-    cpt_codes = service.get("cpt_codes", [])
-    if not cpt_codes and service.get("cpt_code"):
-        cpt_codes = [service["cpt_code"]]
+        logger.info("=== Prior Authorization Workflow Started (id=%s) ===", workflow_id)
 
-    icd10_codes = service.get("icd10_codes", [])
-    if not icd10_codes:
-        diag = _safe_get(request_data, "diagnosis", default={})
-        icd10_codes = diag.get("icd10_codes", [])
+        # One pooled client per run so the RAG call and every audit POST reuse
+        # the same keep-alive connection (closed after the audit flush)
+        http = httpx.AsyncClient(
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        async with http, _audit_buffer(http, toolkit, workflow_id) as audit:
+            # ==============================================================
+            # BEAD 001: Intake — Compliance gate + RAG policy retrieval
+            # ==============================================================
+            if _bead_needs_work(beads, "bd-pa-001-intake"):
+                _update_bead(beads, "bd-pa-001-intake", "in-progress")
+                await _write_waypoint(assessment_path, assessment)
+                logger.info("Bead 001: Intake — compliance gate + policy retrieval")
+
+                # --- Compliance Agent (NPI + ICD-10 validation) and RAG policy
+                # retrieval (folded into intake per skill) are independent, so
+                # run them concurrently ---
+                logger.info("Bead 001: Running Compliance Agent + policy retrieval...")
+                compliance_prompt = _COMPLIANCE_PROMPT % _get_request_json()
+
+                rag_context, compliance_text = await asyncio.gather(
+                    _rag_policy_retrieval(http, toolkit, request_data),
+                    self._run_compliance(compliance_prompt),
+                )
+                assessment["policy"]["rag_context"] = rag_context[:2000] if rag_context else ""
+
+                _queue_audit_event(
+                    audit.events,
+                    "bead-001-intake",
+                    "rag_retrieval",
+                    "success" if rag_context else "skipped",
+                    output_summary=f"Retrieved {len(rag_context)} chars of policy context",
+                )
 
-    request_block = {
-        "member": {
-            "name": member.get("name", ""),
-            "id": member.get("id", ""),
-            "dob": member.get("dob", ""),
-            "state": member.get("state", member.get("plan", "")),
-        },
-        "service": {
-            "type": service.get("type", ""),
-            "description": service.get("description", ""),
-            "cpt_codes": cpt_codes,
-            "icd10_codes": icd10_codes,
-            "place_of_service": service.get("place_of_service", ""),
-        },
-        "provider": {
-            "npi": provider.get("npi", ""),
-            "name": provider.get("name", ""),
-            "specialty": provider.get("specialty", ""),
-            "verified": False,
-        },
-    }
+                compliance_parsed = _extract_json_from_text(compliance_text)
 
-    # ── Initialize assessment skeleton (skill contract) ────────────
-    assessment: dict[str, Any] = (
-        existing
-        if existing and "beads" in existing
-        else {
-            "request_id": request_id,
-            "workflow_id": workflow_id,
-            "created": datetime.now(timezone.utc).isoformat(),
-            "status": "in_progress",
-            "version": "2.0",
-            "beads": beads,
-            "request": request_block,
-            "fhir_patient_context": {
-                "patient_found": False,
-                "fhir_patient_id": None,
-                "active_conditions": [],
-                "active_medications": [],
-                "recent_observations": [],
-                "cross_reference_notes": "",
-            },
-            "clinical": {
-                "chief_complaint": "",
-                "key_findings": [],
-                "prior_treatments": [],
-                "extraction_confidence": 0,
-            },
-            "policy": {
-                "policy_id": "",
-                "policy_title": "",
-                "policy_type": "",
-                "contractor": "",
-                "covered_indications": [],
-                "medical_necessity_check": {
-                    "cpt_code": cpt_codes[0] if cpt_codes else "",
-                    "icd10_codes": icd10_codes,
-                    "is_covered": None,
-                    "policy_basis": "",
-                },
-                "rag_context": "",
-            },
-            "literature_support": {
-                "searched": False,
-                "query_used": "",
-                "articles_found": 0,
-                "key_citations": [],
-                "evidence_summary": "",
-            },
-            "criteria_evaluation": [],
-            "recommendation": {
-                "decision": "",
-                "confidence": "",
-                "confidence_score": 0,
-                "rationale": "",
-                "criteria_met": "",
-                "criteria_percentage": 0,
-                "prerequisite_checks": {
-                    "provider_verified": False,
-                    "codes_valid": False,
-                    "policy_found": False,
-                    "criteria_threshold_met": False,
-                    "confidence_threshold_met": False,
-                },
-                "gaps": [],
-            },
-        }
-    )
+                # --- Populate assessment from compliance output ---
+                if compliance_parsed:
+                    pv = _safe_get(compliance_parsed, "provider_verification", default={})
+                    assessment["request"]["provider"]["verified"] = pv.get("verified", False)
+                    assessment["request"]["provider"]["name"] = pv.get("name", provider.get("name", ""))
+                    assessment["request"]["provider"]["specialty"] = pv.get("specialty", provider.get("specialty", ""))
 
-    logger.info("=== Prior Authorization Workflow Started (id=%s) ===", workflow_id)
-
-    async with toolkit:
-        # ==============================================================
-        # BEAD 001: Intake — Compliance gate + RAG policy retrieval
-        # ==============================================================
-        if _bead_needs_work(beads, "bd-pa-001-intake"):
-            _update_bead(beads, "bd-pa-001-intake", "in-progress")
-            _write_waypoint(assessment_path, assessment)
-            logger.info("Bead 001: Intake — compliance gate + policy retrieval")
-
-            # --- RAG policy retrieval (folded into intake per skill) ---
-            rag_context = await _rag_policy_retrieval(toolkit, request_data)
-            assessment["policy"]["rag_context"] = rag_context[:2000] if rag_context else ""
-
-            await _record_audit_event(
-                toolkit,
-                workflow_id,
-                "bead-001-intake",
-                "rag_retrieval",
-                "success" if rag_context else "skipped",
-                output_summary=f"Retrieved {len(rag_context)} chars of policy context",
-            )
-
-            # --- Compliance Agent (NPI + ICD-10 validation) ---
-            logger.info("Bead 001: Running Compliance Agent...")
-            compliance_agent = create_compliance_agent(
-                client=client,
-                tools=toolkit.compliance_tools(),
-            )
-
-            compliance_prompt = (
-                "Validate the following prior authorization request for compliance.\n"
-                "Check provider NPI, validate all ICD-10 codes, and identify any "
-                "missing fields.\n"
-                "If provider NPI is 1234567890, this is demo mode — mark as verified.\n\n"
-                f"PA Request:\n```json\n{request_json}\n```"
-            )
-
-            async with compliance_agent:
-                compliance_result = await compliance_agent.run(compliance_prompt)
-
-            compliance_text = str(compliance_result)
-            compliance_parsed = _extract_json_from_text(compliance_text)
-
-            # --- Populate assessment from compliance output ---
-            if compliance_parsed:
-                pv = _safe_get(compliance_parsed, "provider_verification", default={})
-                assessment["request"]["provider"]["verified"] = pv.get("verified", False)
-                assessment["request"]["provider"]["name"] = pv.get("name", provider.get("name", ""))
-                assessment["request"]["provider"]["specialty"] = pv.get("specialty", provider.get("specialty", ""))
-
-                cv = _safe_get(compliance_parsed, "code_validation", default={})
-                checks = assessment["recommendation"]["prerequisite_checks"]
-                checks["codes_valid"] = cv.get("all_codes_valid", False)
-                checks["provider_verified"] = pv.get("verified", False)
-
-            can_proceed = _check_compliance_gate(compliance_text)
-            logger.info("Bead 001: Compliance result — can_proceed=%s", can_proceed)
-
-            await _record_audit_event(
-                toolkit,
-                workflow_id,
-                "bead-001-intake",
-                "compliance_check",
-                "success" if can_proceed else "failure",
-                agent_name="ComplianceAgent",
-                input_summary=f"PA request with {len(icd10_codes)} ICD-10 codes",
-                output_summary=f"can_proceed={can_proceed}",
-            )
-
-            if not can_proceed:
-                logger.info("Compliance gate FAILED — generating PEND assessment")
-                assessment["recommendation"]["decision"] = "PEND"
-                assessment["recommendation"]["rationale"] = (
-                    "Compliance gate failed. Review compliance results and resubmit."
+                    cv = _safe_get(compliance_parsed, "code_validation", default={})
+                    checks = assessment["recommendation"]["prerequisite_checks"]
+                    checks["codes_valid"] = cv.get("all_codes_valid", False)
+                    checks["provider_verified"] = pv.get("verified", False)
+
+                can_proceed = _check_compliance_gate(compliance_parsed, compliance_text)
+                logger.info("Bead 001: Compliance result — can_proceed=%s", can_proceed)
+
+                _queue_audit_event(
+                    audit.events,
+                    "bead-001-intake",
+                    "compliance_check",
+                    "success" if can_proceed else "failure",
+                    agent_name="ComplianceAgent",
+                    input_summary=f"PA request with {len(icd10_codes)} ICD-10 codes",
+                    output_summary=f"can_proceed={can_proceed}",
                 )
-                assessment["recommendation"]["gaps"] = [
-                    {
-                        "what": "Compliance check failed",
-                        "critical": True,
-                        "request": "Review and resubmit",
-                    }
-                ]
-                assessment["status"] = "gated_at_compliance"
+
+                if not can_proceed:
+                    logger.info("Compliance gate FAILED — generating PEND assessment")
+                    assessment["recommendation"]["decision"] = "PEND"
+                    assessment["recommendation"]["rationale"] = (
+                        "Compliance gate failed. Review compliance results and resubmit."
+                    )
+                    assessment["recommendation"]["gaps"] = [
+                        {
+                            "what": "Compliance check failed",
+                            "critical": True,
+                            "request": "Review and resubmit",
+                        }
+                    ]
+                    assessment["status"] = "gated_at_compliance"
+                    _update_bead(beads, "bd-pa-001-intake", "completed")
+                    await _write_waypoint(assessment_path, assessment)
+                    return assessment
+
+                # --- Context Checkpoint 1: persist intake results ---
                 _update_bead(beads, "bd-pa-001-intake", "completed")
-                _write_waypoint(assessment_path, assessment)
-                return assessment
-
-            # --- Context Checkpoint 1: persist intake results ---
-            _update_bead(beads, "bd-pa-001-intake", "completed")
-            assessment["_raw_compliance"] = compliance_text[:3000]
-            _write_waypoint(assessment_path, assessment)
-            logger.info("Bead 001: COMPLETED — context checkpoint 1 written")
-
-        # ==============================================================
-        # BEAD 002: Clinical — Concurrent clinical review + coverage
-        # ==============================================================
-        if _bead_needs_work(beads, "bd-pa-002-clinical"):
-            _update_bead(beads, "bd-pa-002-clinical", "in-progress")
-            _write_waypoint(assessment_path, assessment)
-            logger.info("Bead 002: Clinical review + coverage (concurrent)")
-
-            compliance_text = assessment.get("_raw_compliance", "")
-
-            clinical_agent = create_clinical_reviewer_agent(
-                client=client,
-                tools=toolkit.clinical_reviewer_tools(),
-            )
-            coverage_agent = create_coverage_agent(
-                client=client,
-                tools=toolkit.coverage_tools(),
-            )
-
-            rag_section = ""
-            rag_ctx = assessment.get("policy", {}).get("rag_context", "")
-            if rag_ctx:
-                rag_section = "\n\n## Indexed Payer Policy Context (from RAG)\n" + rag_ctx
-
-            combined_prompt = (
-                "You are part of a prior authorization review team. Below is the "
-                "PA request and compliance results. Perform YOUR specific role as "
-                "described in your instructions.\n\n"
-                f"PA Request:\n```json\n{request_json}\n```\n\n"
-                f"Compliance Results:\n{compliance_text}"
-                f"{rag_section}"
-            )
-
-            concurrent_workflow = ConcurrentBuilder(
-                participants=[clinical_agent, coverage_agent],
-            ).build()
-
-            async with clinical_agent, coverage_agent:
-                concurrent_results = await concurrent_workflow.run(combined_prompt)
-
-            concurrent_text = str(concurrent_results)
-            logger.info("Bead 002: Concurrent phase produced %d chars", len(concurrent_text))
-
-            # --- Parse clinical reviewer output ---
-            clinical_parsed = _extract_json_from_text(concurrent_text)
-            if clinical_parsed:
-                cs = _safe_get(clinical_parsed, "clinical_summary", default={})
-                assessment["clinical"]["chief_complaint"] = cs.get(
-                    "primary_diagnosis",
-                    _safe_get(request_data, "clinical_summary", default=""),
+                # Side log first, so a completed bead always has its raw output
+                raw_outputs["compliance"] = compliance_text[:3000]
+                await _append_raw_output(
+                    raw_outputs_path, "bd-pa-001-intake", "compliance", raw_outputs["compliance"]
                 )
-                assessment["clinical"]["key_findings"] = cs.get("clinical_indicators", [])
-                assessment["clinical"]["prior_treatments"] = (
-                    [cs["treatment_history"]] if cs.get("treatment_history") else []
+                await _write_waypoint(assessment_path, assessment)
+                audit.send()
+                logger.info("Bead 001: COMPLETED — context checkpoint 1 written")
+
+            # ==============================================================
+            # BEAD 002: Clinical — Concurrent clinical review + coverage
+            # ==============================================================
+            if _bead_needs_work(beads, "bd-pa-002-clinical"):
+                _update_bead(beads, "bd-pa-002-clinical", "in-progress")
+                await _write_waypoint(assessment_path, assessment)
+                logger.info("Bead 002: Clinical review + coverage (concurrent)")
+
+                if not _has_clinical_evidence(request_data):
+                    # Nothing for the reviewers to map — save both LLM calls
+                    logger.info("Bead 002: No clinical evidence in request — skipping concurrent review")
+                    concurrent_text = "[skipped: no clinical evidence]"
+                    _queue_audit_event(
+                        audit.events,
+                        "bead-002-clinical",
+                        "clinical_gate",
+                        "skipped",
+                        output_summary="No clinical documentation or ICD-10 codes in request",
+                    )
+                else:
+                    compliance_text = raw_outputs.get("compliance", "")
+
+                    rag_section = ""
+                    rag_ctx = assessment.get("policy", {}).get("rag_context", "")
+                    if rag_ctx:
+                        rag_section = _RAG_SECTION_PROMPT % rag_ctx
+
+                    combined_prompt = _CLINICAL_PROMPT % (_get_request_json(), compliance_text, rag_section)
+
+                    clinical_agent = create_clinical_reviewer_agent(
+                        client=self.client,
+                        tools=toolkit.clinical_reviewer_tools(),
+                    )
+                    coverage_agent = create_coverage_agent(
+                        client=self.client,
+                        tools=toolkit.coverage_tools(),
+                    )
+                    concurrent_workflow = ConcurrentBuilder(
+                        participants=[clinical_agent, coverage_agent],
+                    ).build()
+
+                    async with clinical_agent, coverage_agent:
+                        concurrent_results = await concurrent_workflow.run(combined_prompt)
+
+                    concurrent_text = str(concurrent_results)
+                    logger.info("Bead 002: Concurrent phase produced %d chars", len(concurrent_text))
+
+                    # --- Parse both reviewers' output in worker threads ---
+                    # Coverage JSON usually follows the clinical object; parse the
+                    # remainder alongside so the loop isn't blocked on either scan
+                    first_close = concurrent_text.find("}")
+                    remainder = concurrent_text[first_close + 1 :] if first_close > 0 else ""
+                    clinical_parsed, remainder_parsed = await asyncio.gather(
+                        asyncio.to_thread(_extract_json_from_text, concurrent_text),
+                        asyncio.to_thread(_extract_json_from_text, remainder),
+                    )
+
+                    # --- Clinical reviewer output ---
+                    if clinical_parsed:
+                        cs = _safe_get(clinical_parsed, "clinical_summary", default={})
+                        assessment["clinical"]["chief_complaint"] = cs.get(
+                            "primary_diagnosis",
+                            _safe_get(request_data, "clinical_summary", default=""),
+                        )
+                        assessment["clinical"]["key_findings"] = cs.get("clinical_indicators", [])
+                        assessment["clinical"]["prior_treatments"] = (
+                            [cs["treatment_history"]] if cs.get("treatment_history") else []
+                        )
+                        assessment["clinical"]["extraction_confidence"] = clinical_parsed.get("clinical_confidence", 70)
+
+                        # Evidence mapping → criteria_evaluation
+                        em = clinical_parsed.get("evidence_mapping", [])
+                        assessment["criteria_evaluation"] = [
+                            {
+                                "criterion": item.get("criterion", ""),
+                                "status": item.get("status", "INSUFFICIENT"),
+                                "evidence": item.get("evidence", ""),
+                                "notes": "",
+                                "confidence": item.get("confidence", 50),
+                            }
+                            for item in em
+                        ]
+
+                        # Literature support
+                        lit = clinical_parsed.get("literature_support", [])
+                        if lit:
+                            assessment["literature_support"]["searched"] = True
+                            assessment["literature_support"]["articles_found"] = len(lit)
+                            assessment["literature_support"]["key_citations"] = lit[:5]
+
+                        # FHIR patient context
+                        fhir_ctx = clinical_parsed.get("patient_data", {})
+                        if fhir_ctx:
+                            assessment["fhir_patient_context"]["patient_found"] = True
+                            assessment["fhir_patient_context"]["active_conditions"] = fhir_ctx.get("conditions", [])
+
+                    # --- Coverage agent output ---
+                    if clinical_parsed and "coverage_status" in clinical_parsed:
+                        coverage_parsed = clinical_parsed
+                    else:
+                        coverage_parsed = remainder_parsed
+
+                    if coverage_parsed and "applicable_policies" in coverage_parsed:
+                        policies = coverage_parsed.get("applicable_policies", [])
+                        if policies:
+                            p = policies[0]
+                            assessment["policy"]["policy_id"] = p.get("policy_id", "")
+                            assessment["policy"]["policy_title"] = p.get("title", "")
+                            assessment["policy"]["policy_type"] = p.get("type", "LCD")
+                            assessment["policy"]["covered_indications"] = p.get("coverage_criteria", [])
+                            checks = assessment["recommendation"]["prerequisite_checks"]
+                            checks["policy_found"] = True
+
+                        mn = _safe_get(coverage_parsed, "medical_necessity", default={})
+                        if mn:
+                            mnc = assessment["policy"]["medical_necessity_check"]
+                            mnc["is_covered"] = mn.get("is_medically_necessary")
+                            mnc["policy_basis"] = mn.get("rationale", "")
+
+                    _queue_audit_event(
+                        audit.events,
+                        "bead-002-clinical",
+                        "concurrent_review",
+                        "success",
+                        agent_name="ClinicalReviewer+CoverageAgent",
+                        output_summary=(
+                            f"Produced {len(concurrent_text)} chars; "
+                            f"criteria_count={len(assessment['criteria_evaluation'])}"
+                        ),
+                    )
+
+                # --- Context Checkpoint 2 ---
+                _update_bead(beads, "bd-pa-002-clinical", "completed")
+                raw_outputs["concurrent"] = concurrent_text[:5000]
+                await _append_raw_output(
+                    raw_outputs_path, "bd-pa-002-clinical", "concurrent", raw_outputs["concurrent"]
                 )
-                assessment["clinical"]["extraction_confidence"] = clinical_parsed.get("clinical_confidence", 70)
-
-                # Evidence mapping → criteria_evaluation
-                em = clinical_parsed.get("evidence_mapping", [])
-                assessment["criteria_evaluation"] = [
-                    {
-                        "criterion": item.get("criterion", ""),
-                        "status": item.get("status", "INSUFFICIENT"),
-                        "evidence": item.get("evidence", ""),
-                        "notes": "",
-                        "confidence": item.get("confidence", 50),
+                await _write_waypoint(assessment_path, assessment)
+                audit.send()
+                logger.info("Bead 002: COMPLETED — context checkpoint 2 written")
+
+            # ==============================================================
+            # BEAD 003: Recommend — Synthesis agent → recommendation
+            # ==============================================================
+            if _bead_needs_work(beads, "bd-pa-003-recommend"):
+                _update_bead(beads, "bd-pa-003-recommend", "in-progress")
+                await _write_waypoint(assessment_path, assessment)
+                logger.info("Bead 003: Synthesis — generating recommendation")
+
+                compliance_text = raw_outputs.get("compliance", "")
+                concurrent_text = raw_outputs.get("concurrent", "")
+
+                synthesis_prompt = _SYNTHESIS_PROMPT % (_get_request_json(), compliance_text, concurrent_text)
+
+                synthesis_result = await self.synthesis_agent.run(synthesis_prompt)
+                synthesis_text = str(synthesis_result)
+                synthesis_parsed = _extract_json_from_text(synthesis_text)
+
+                # --- Populate recommendation block ---
+                if synthesis_parsed:
+                    rec = synthesis_parsed.get("recommendation", "PEND")
+                    if isinstance(rec, dict):
+                        rec = rec.get("decision", "PEND")
+
+                    confidence_score = synthesis_parsed.get("confidence_score", 0)
+                    if confidence_score >= 80:
+                        confidence_level = "HIGH"
+                    elif confidence_score >= 60:
+                        confidence_level = "MEDIUM"
+                    else:
+                        confidence_level = "LOW"
+
+                    criteria_summary = synthesis_parsed.get("criteria_summary", [])
+                    # One pass: count MET criteria and build the evaluation rows
+                    met_count = 0
+                    summary_rows = []
+                    for c in criteria_summary:
+                        status = c.get("status", "INSUFFICIENT")
+                        if isinstance(status, str) and status.upper() == "MET":
+                            met_count += 1
+                        summary_rows.append(
+                            {
+                                "criterion": c.get("criterion", ""),
+                                "status": status,
+                                "evidence": c.get("evidence", ""),
+                                "notes": "",
+                                "confidence": c.get("confidence", 50),
+                            }
+                        )
+                    total = max(
+                        len(criteria_summary),
+                        len(assessment["criteria_evaluation"]),
+                        1,
+                    )
+
+                    assessment["recommendation"] = {
+                        "decision": rec.upper() if isinstance(rec, str) else "PEND",
+                        "confidence": confidence_level,
+                        "confidence_score": confidence_score,
+                        "rationale": synthesis_parsed.get(
+                            "summary",
+                            synthesis_parsed.get("approval_rationale", synthesis_text[:500]),
+                        ),
+                        "criteria_met": f"{met_count}/{total}",
+                        "criteria_percentage": round(met_count / total * 100),
+                        "prerequisite_checks": assessment["recommendation"]["prerequisite_checks"],
+                        "gaps": [
+                            {"what": r, "critical": True, "request": r}
+                            for r in synthesis_parsed.get(
+                                "pend_reasons",
+                                synthesis_parsed.get("required_actions", []),
+                            )
+                        ],
                     }
-                    for item in em
-                ]
-
-                # Literature support
-                lit = clinical_parsed.get("literature_support", [])
-                if lit:
-                    assessment["literature_support"]["searched"] = True
-                    assessment["literature_support"]["articles_found"] = len(lit)
-                    assessment["literature_support"]["key_citations"] = lit[:5]
-
-                # FHIR patient context
-                fhir_ctx = clinical_parsed.get("patient_data", {})
-                if fhir_ctx:
-                    assessment["fhir_patient_context"]["patient_found"] = True
-                    assessment["fhir_patient_context"]["active_conditions"] = fhir_ctx.get("conditions", [])
-
-            # --- Parse coverage agent output ---
-            coverage_parsed = None
-            if clinical_parsed and "coverage_status" in clinical_parsed:
-                coverage_parsed = clinical_parsed
-            else:
-                first_close = concurrent_text.find("}")
-                if first_close > 0:
-                    remainder = concurrent_text[first_close + 1 :]
-                    coverage_parsed = _extract_json_from_text(remainder)
-
-            if coverage_parsed and "applicable_policies" in coverage_parsed:
-                policies = coverage_parsed.get("applicable_policies", [])
-                if policies:
-                    p = policies[0]
-                    assessment["policy"]["policy_id"] = p.get("policy_id", "")
-                    assessment["policy"]["policy_title"] = p.get("title", "")
-                    assessment["policy"]["policy_type"] = p.get("type", "LCD")
-                    assessment["policy"]["covered_indications"] = p.get("coverage_criteria", [])
-                    checks = assessment["recommendation"]["prerequisite_checks"]
-                    checks["policy_found"] = True
-
-                mn = _safe_get(coverage_parsed, "medical_necessity", default={})
-                if mn:
-                    mnc = assessment["policy"]["medical_necessity_check"]
-                    mnc["is_covered"] = mn.get("is_medically_necessary")
-                    mnc["policy_basis"] = mn.get("rationale", "")
-
-            await _record_audit_event(
-                toolkit,
-                workflow_id,
-                "bead-002-clinical",
-                "concurrent_review",
-                "success",
-                agent_name="ClinicalReviewer+CoverageAgent",
-                output_summary=(
-                    f"Produced {len(concurrent_text)} chars; "
-                    f"criteria_count={len(assessment['criteria_evaluation'])}"
-                ),
-            )
-
-            # --- Context Checkpoint 2 ---
-            _update_bead(beads, "bd-pa-002-clinical", "completed")
-            assessment["_raw_concurrent"] = concurrent_text[:5000]
-            _write_waypoint(assessment_path, assessment)
-            logger.info("Bead 002: COMPLETED — context checkpoint 2 written")
-
-        # ==============================================================
-        # BEAD 003: Recommend — Synthesis agent → recommendation
-        # ==============================================================
-        if _bead_needs_work(beads, "bd-pa-003-recommend"):
-            _update_bead(beads, "bd-pa-003-recommend", "in-progress")
-            _write_waypoint(assessment_path, assessment)
-            logger.info("Bead 003: Synthesis — generating recommendation")
-
-            compliance_text = assessment.get("_raw_compliance", "")
-            concurrent_text = assessment.get("_raw_concurrent", "")
-
-            synthesis_agent = create_synthesis_agent(client=client)
-
-            synthesis_prompt = (
-                "Aggregate the following agent outputs into a final prior "
-                "authorization assessment.\n"
-                "Apply the decision rubric strictly.\n\n"
-                f"## Original PA Request\n```json\n{request_json}\n```\n\n"
-                f"## Compliance Agent Output\n{compliance_text}\n\n"
-                f"## Clinical Review + Coverage Agent Outputs\n{concurrent_text}\n\n"
-                "Produce your final structured assessment JSON with:\n"
-                '  "recommendation": "APPROVE" or "PEND"\n'
-                '  "confidence_score": 0-100\n'
-                '  "confidence_breakdown": {provider, codes, policy, clinical, '
-                "doc_quality}\n"
-                '  "criteria_summary": [{criterion, status, evidence}]\n'
-                '  "pend_reasons": [...] if PEND\n'
-                '  "required_actions": [...] if PEND\n'
-                '  "summary": "2-3 sentence executive summary"'
-            )
-
-            synthesis_result = await synthesis_agent.run(synthesis_prompt)
-            synthesis_text = str(synthesis_result)
-            synthesis_parsed = _extract_json_from_text(synthesis_text)
-
-            # --- Populate recommendation block ---
-            if synthesis_parsed:
-                rec = synthesis_parsed.get("recommendation", "PEND")
-                if isinstance(rec, dict):
-                    rec = rec.get("decision", "PEND")
-
-                confidence_score = synthesis_parsed.get("confidence_score", 0)
-                if confidence_score >= 80:
-                    confidence_level = "HIGH"
-                elif confidence_score >= 60:
-                    confidence_level = "MEDIUM"
+
+                    if summary_rows and len(summary_rows) >= len(assessment["criteria_evaluation"]):
+                        assessment["criteria_evaluation"] = summary_rows
+
+                    cb = synthesis_parsed.get("confidence_breakdown", {})
+                    if cb:
+                        checks = assessment["recommendation"]["prerequisite_checks"]
+                        checks["provider_verified"] = cb.get("provider", 0) >= 60
+                        checks["codes_valid"] = cb.get("codes", 0) >= 60
+                        checks["policy_found"] = cb.get("policy", 0) >= 60
+                        checks["criteria_threshold_met"] = assessment["recommendation"]["criteria_percentage"] >= 80
+                        checks["confidence_threshold_met"] = confidence_score >= 60
                 else:
-                    confidence_level = "LOW"
-
-                criteria_summary = synthesis_parsed.get("criteria_summary", [])
-                met_count = sum(1 for c in criteria_summary if c.get("status", "").upper() == "MET")
-                total = max(
-                    len(criteria_summary),
-                    len(assessment["criteria_evaluation"]),
-                    1,
+                    # Unparseable JSON — read the recommendation field directly rather
+                    # than keyword-scanning prose ("did NOT approve" is not APPROVE).
+                    m = _RECOMMENDATION_RE.search(synthesis_text)
+                    rec = m.group(1).upper() if m else "PEND"
+                    assessment["recommendation"]["decision"] = rec
+                    assessment["recommendation"]["rationale"] = synthesis_text[:500]
+
+                logger.info(
+                    "Bead 003: Recommendation=%s, Confidence=%s",
+                    assessment["recommendation"]["decision"],
+                    assessment["recommendation"]["confidence_score"],
                 )
 
-                assessment["recommendation"] = {
-                    "decision": rec.upper() if isinstance(rec, str) else "PEND",
-                    "confidence": confidence_level,
-                    "confidence_score": confidence_score,
-                    "rationale": synthesis_parsed.get(
-                        "summary",
-                        synthesis_parsed.get("approval_rationale", synthesis_text[:500]),
+                _queue_audit_event(
+                    audit.events,
+                    "bead-003-recommend",
+                    "recommendation_rendered",
+                    "success",
+                    agent_name="SynthesisAgent",
+                    output_summary=(
+                        f"decision={assessment['recommendation']['decision']}, "
+                        f"confidence={assessment['recommendation']['confidence_score']}"
                     ),
-                    "criteria_met": f"{met_count}/{total}",
-                    "criteria_percentage": round(met_count / total * 100),
-                    "prerequisite_checks": assessment["recommendation"]["prerequisite_checks"],
-                    "gaps": [
-                        {"what": r, "critical": True, "request": r}
-                        for r in synthesis_parsed.get(
-                            "pend_reasons",
-                            synthesis_parsed.get("required_actions", []),
-                        )
-                    ],
-                }
+                )
 
-                if criteria_summary and len(criteria_summary) >= len(assessment["criteria_evaluation"]):
-                    assessment["criteria_evaluation"] = [
-                        {
-                            "criterion": c.get("criterion", ""),
-                            "status": c.get("status", "INSUFFICIENT"),
-                            "evidence": c.get("evidence", ""),
-                            "notes": "",
-                            "confidence": c.get("confidence", 50),
-                        }
-                        for c in criteria_summary
-                    ]
+                # --- Generate audit justification document ---
+                audit_doc = _generate_audit_justification(assessment)
+                await _write_output_file(output_path / "audit_justification.md", audit_doc)
 
-                cb = synthesis_parsed.get("confidence_breakdown", {})
-                if cb:
-                    checks = assessment["recommendation"]["prerequisite_checks"]
-                    checks["provider_verified"] = cb.get("provider", 0) >= 60
-                    checks["codes_valid"] = cb.get("codes", 0) >= 60
-                    checks["policy_found"] = cb.get("policy", 0) >= 60
-                    checks["criteria_threshold_met"] = assessment["recommendation"]["criteria_percentage"] >= 80
-                    checks["confidence_threshold_met"] = confidence_score >= 60
-            else:
-                rec = "PEND"
-                if "approve" in synthesis_text.lower() and "pend" not in synthesis_text.lower():
-                    rec = "APPROVE"
-                assessment["recommendation"]["decision"] = rec
-                assessment["recommendation"]["rationale"] = synthesis_text[:500]
-
-            logger.info(
-                "Bead 003: Recommendation=%s, Confidence=%s",
-                assessment["recommendation"]["decision"],
-                assessment["recommendation"]["confidence_score"],
-            )
-
-            await _record_audit_event(
-                toolkit,
-                workflow_id,
-                "bead-003-recommend",
-                "recommendation_rendered",
-                "success",
-                agent_name="SynthesisAgent",
-                output_summary=(
-                    f"decision={assessment['recommendation']['decision']}, "
-                    f"confidence={assessment['recommendation']['confidence_score']}"
-                ),
-            )
-
-            # --- Generate audit justification document ---
-            audit_doc = _generate_audit_justification(assessment)
-            _write_output_file(output_path / "audit_justification.md", audit_doc)
-
-            # --- Context Checkpoint 3: finalize assessment ---
-            assessment["status"] = "assessment_complete"
-            assessment.pop("_raw_compliance", None)
-            assessment.pop("_raw_concurrent", None)
-
-            _update_bead(beads, "bd-pa-003-recommend", "completed")
-            _write_waypoint(assessment_path, assessment)
-            logger.info("Bead 003: COMPLETED — assessment_complete")
-
-    logger.info("=== Subskill 1 Complete — Assessment ready for human review ===")
-    logger.info("Run directory: %s", run_dir)
-    return assessment
+                # --- Context Checkpoint 3: finalize assessment ---
+                assessment["status"] = "assessment_complete"
+                # Drop inline raw texts carried over from a pre-side-log waypoint
+                assessment.pop("_raw_compliance", None)
+                assessment.pop("_raw_concurrent", None)
+
+                _update_bead(beads, "bd-pa-003-recommend", "completed")
+                await _write_waypoint(assessment_path, assessment)
+                logger.info("Bead 003: COMPLETED — assessment_complete")
+
+        logger.info("=== Subskill 1 Complete — Assessment ready for human review ===")
+        logger.info("Run directory: %s", run_dir)
+        return assessment
+
+
+# Runners are bound to the event loop their HTTP clients were created on,
+# so cache them per loop (dropped when the loop is garbage-collected).
+_runners: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple, PriorAuthRunner]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_runner(config: AgentConfig, local: bool) -> PriorAuthRunner:
+    """Get or create the shared runner for this event loop and configuration."""
+    runners = _runners.setdefault(asyncio.get_running_loop(), {})
+    key = (config.endpoints, config.openai, config.apim_subscription_key, local)
+    runner = runners.get(key)
+    if runner is None:
+        runner = PriorAuthRunner(config, local=local)
+        runners[key] = runner
+    return runner
+
+
+async def run_prior_auth_workflow(
+    request_data: dict[str, Any],
+    config: AgentConfig | None = None,
+    *,
+    output_dir: str | None = None,
+    local: bool = False,
+    runner: PriorAuthRunner | None = None,
+) -> dict[str, Any]:
+    """
+    Execute the Prior Authorization multi-agent workflow (Subskill 1).
+
+    Thin wrapper around a shared :class:`PriorAuthRunner` so repeated calls
+    on one event loop with the same configuration reuse the LLM client and
+    MCP toolkit.
+
+    Args:
+        request_data: PA request (member, service, provider, clinical docs).
+        config: Optional AgentConfig override; loads from env if None.
+        output_dir: Directory for run files. Defaults to .runs/<timestamp>_<id>/.
+        local: If True, use localhost MCP endpoints.
+        runner: Optional runner built once at server startup; when given,
+            ``config`` and ``local`` are ignored.
+
+    Returns:
+        Skill-compatible assessment dict (also written to waypoints/assessment.json).
+    """
+    if runner is None:
+        if config is None:
+            # Re-read every call: DevUI saves new settings into os.environ
+            config = AgentConfig.load(local=local)
+        runner = _get_runner(config, local)
+    return await runner.run(request_data, output_dir=output_dir)
 
 
 # ---------------------------------------------------------------------------
@@ -955,35 +1313,41 @@ async def run_prior_auth_decision(
     decision_path = waypoint_dir / "decision.json"
 
     # --- Load assessment ---
-    assessment = _read_waypoint(assessment_path)
+    assessment = await asyncio.to_thread(_read_waypoint, assessment_path)
     if not assessment or assessment.get("status") != "assessment_complete":
         raise ValueError("Assessment not found or incomplete. Complete Subskill 1 first.")
 
-    beads = assessment.get("beads", _make_beads())
+    beads = _index_beads(assessment.get("beads", []))
     request_id = assessment.get("request_id", "")
 
     outcome = decision_input.get("outcome", "PENDING").upper()
     override_applied = decision_input.get("override_applied", False)
-    original_rec = assessment.get("recommendation", {}).get("decision", "PEND")
+    rec_block = assessment.get("recommendation") or {}
+    policy_block = assessment.get("policy") or {}
+    original_rec = rec_block.get("decision", "PEND")
 
     # ==================================================================
     # BEAD 004: Decision capture
     # ==================================================================
     _update_bead(beads, "bd-pa-004-decision", "in-progress")
 
+    # One clock read for every date this decision records or prints
+    now = datetime.now(timezone.utc)
+    decided_at = now.isoformat()
+
     auth_number = None
     valid_from = None
     valid_through = None
 
     if outcome == "APPROVED":
-        auth_number = f"PA-{datetime.now(timezone.utc).strftime('%Y%m%d')}-" f"{uuid.uuid4().hex[:5].upper()}"
-        valid_from = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        valid_through = (datetime.now(timezone.utc) + timedelta(days=30)).strftime("%Y-%m-%d")
+        auth_number = _pa_number(now)
+        valid_from = now.strftime("%Y-%m-%d")
+        valid_through = (now + timedelta(days=30)).strftime("%Y-%m-%d")
 
     decision: dict[str, Any] = {
         "request_id": request_id,
-        "decision_date": datetime.now(timezone.utc).isoformat(),
-        "beads": beads,
+        "decision_date": decided_at,
+        "beads": list(beads.values()),
         "decision": {
             "outcome": outcome,
             "auth_number": auth_number,
@@ -998,13 +1362,13 @@ async def run_prior_auth_decision(
                 assessment["recommendation"]["rationale"],
             ),
             "supporting_facts": [],
-            "policy_basis": assessment.get("policy", {}).get("policy_title", ""),
+            "policy_basis": policy_block.get("policy_title", ""),
         },
         "audit": {
             "reviewed_by": decision_input.get("overriding_authority", "AI-Assisted Review"),
-            "review_date": datetime.now(timezone.utc).isoformat(),
+            "review_date": decided_at,
             "turnaround_hours": None,
-            "confidence": assessment.get("recommendation", {}).get("confidence", ""),
+            "confidence": rec_block.get("confidence", ""),
             "auto_approved": not override_applied and outcome == "APPROVED",
         },
         "override_details": (
@@ -1020,7 +1384,7 @@ async def run_prior_auth_decision(
     }
 
     _update_bead(beads, "bd-pa-004-decision", "completed")
-    _write_waypoint(decision_path, decision)
+    await _write_waypoint(decision_path, decision)
     logger.info("Bead 004: COMPLETED — decision captured: %s", outcome)
 
     # ==================================================================
@@ -1030,16 +1394,16 @@ async def run_prior_auth_decision(
 
     # --- Determination JSON (prompt module 05 schema) ---
     determination = _generate_determination_json(assessment, decision)
-    _write_output_file(
-        output_path / "determination.json",
-        json.dumps(determination, indent=2, default=str),
-    )
+    outputs: dict[str, str | bytes] = {
+        "determination.json": orjson.dumps(determination, default=str, option=orjson.OPT_INDENT_2),
+    }
 
     # --- Notification letter ---
-    member = assessment.get("request", {}).get("member", {})
-    service_block = assessment.get("request", {}).get("service", {})
-    provider_block = assessment.get("request", {}).get("provider", {})
-    rec_block = assessment.get("recommendation", {})
+    request_block = assessment.get("request") or {}
+    member = request_block.get("member") or {}
+    service_block = request_block.get("service") or {}
+    provider_block = request_block.get("provider") or {}
+    letter_date = now.strftime("%B %d, %Y")
 
     if outcome == "APPROVED":
         letter = _generate_approval_letter(
@@ -1048,69 +1412,219 @@ async def run_prior_auth_decision(
             provider_block,
             decision["decision"],
             request_id,
+            letter_date,
         )
-        _write_output_file(output_path / "approval_letter.md", letter)
+        outputs["approval_letter.md"] = letter
     elif outcome == "PENDING":
         letter = _generate_pend_letter(
             member,
             service_block,
             rec_block.get("gaps", []),
             request_id,
+            letter_date,
         )
-        _write_output_file(output_path / "pend_letter.md", letter)
+        outputs["pend_letter.md"] = letter
     elif outcome == "DENIED":
         letter = _generate_denial_letter(
             member,
             service_block,
-            assessment.get("policy", {}),
+            policy_block,
             decision_input.get("justification", ""),
             request_id,
+            letter_date,
         )
-        _write_output_file(output_path / "denial_letter.md", letter)
+        outputs["denial_letter.md"] = letter
+
+    # Independent files — write them concurrently, then mark the bead done
+    await asyncio.gather(*(_write_output_file(output_path / name, text) for name, text in outputs.items()))
 
     _update_bead(beads, "bd-pa-005-notify", "completed")
-    decision["beads"] = beads
-    _write_waypoint(decision_path, decision)
+    await _write_waypoint(decision_path, decision)
     logger.info("Bead 005: COMPLETED — notification artifacts generated")
 
     return decision
 
 
+async def run_prior_auth_decision_batch(
+    decision_inputs: list[dict[str, Any]],
+    output_dirs: list[str],
+    *,
+    max_concurrency: int = 32,
+) -> list[dict[str, Any]]:
+    """
+    Execute Subskill 2 for many completed assessments at once.
+
+    Each decision is independent (its own run directory and files), so
+    they run concurrently; the semaphore bounds open files and threads.
+
+    Args:
+        decision_inputs: One human decision per run (see run_prior_auth_decision).
+        output_dirs: Run directory for each decision, in the same order. Each
+            must be given explicitly and name a different run; two decisions
+            on one run would race on its determination and letters.
+        max_concurrency: Maximum decisions in flight at once.
+
+    Returns:
+        Decision dicts in input order.
+
+    Raises:
+        ValueError: If the lists differ in length, an entry is not a
+            directory path, or two entries resolve to the same run.
+    """
+    if len(decision_inputs) != len(output_dirs):
+        raise ValueError("decision_inputs and output_dirs must be the same length")
+    seen: set[Path] = set()
+    for output_dir in output_dirs:
+        if not isinstance(output_dir, str) or not output_dir:
+            raise ValueError(f"Each output_dirs entry must be a run directory path, got {output_dir!r}")
+        resolved = Path(output_dir).resolve()
+        if resolved in seen:
+            raise ValueError(f"Duplicate run directory in output_dirs: {resolved}")
+        seen.add(resolved)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _decide(decision_input: dict[str, Any], output_dir: str) -> dict[str, Any]:
+        async with semaphore:
+            return await run_prior_auth_decision(decision_input, output_dir=output_dir)
+
+    return list(await asyncio.gather(*map(_decide, decision_inputs, output_dirs)))
+
+
 # ---------------------------------------------------------------------------
 # Output generators (skill contract templates)
 # ---------------------------------------------------------------------------
 
+_STATUS_ICON = {"MET": "✅", "NOT_MET": "❌", "INSUFFICIENT": "⚠️"}
+
+# Prompt module 05 vocabulary for determination.json
+_DETERMINATION = {
+    "APPROVED": "Approved",
+    "DENIED": "Rejected",
+    "PENDING": "Needs More Information",
+}
+_CRITERION_ASSESSMENT = {
+    "MET": "Fully Met",
+    "NOT_MET": "Not Met",
+    "INSUFFICIENT": "Partially Met",
+}
+
+# Letter bodies are built once at import and filled with a single %-format
+_APPROVAL_LETTER = (
+    "# Prior Authorization Approval\n\n"
+    "**Date:** %(today)s\n"
+    "**Authorization Number:** %(auth_number)s\n\n"
+    "---\n\n"
+    "**Member Information:**\n"
+    "- Name: %(member_name)s\n"
+    "- Member ID: %(member_id)s\n"
+    "- Date of Birth: %(member_dob)s\n\n"
+    "**Approved Service:**\n"
+    "- Description: %(service_description)s\n"
+    "- CPT Code(s): %(cpt_codes)s\n"
+    "- Provider: %(provider_name)s "
+    "(NPI: %(provider_npi)s)\n\n"
+    "**Authorization Period:**\n"
+    "- Valid From: %(valid_from)s\n"
+    "- Valid Through: %(valid_through)s\n\n"
+    "**Limitations/Conditions:**\n%(limitations)s\n\n"
+    "---\n\n"
+    "This authorization confirms that the requested service meets medical\n"
+    "necessity criteria based on the clinical information provided.\n\n"
+    "If you have questions, please contact the utilization management "
+    "department.\n"
+)
+
+_PEND_LETTER = (
+    "# Prior Authorization - Additional Information Required\n\n"
+    "**Date:** %(today)s\n"
+    "**Reference Number:** %(request_id)s\n\n"
+    "---\n\n"
+    "**Member Information:**\n"
+    "- Name: %(member_name)s\n"
+    "- Member ID: %(member_id)s\n\n"
+    "**Requested Service:**\n"
+    "- Description: %(service_description)s\n"
+    "- CPT Code(s): %(cpt_codes)s\n\n"
+    "---\n\n"
+    "## Information Needed\n\n"
+    "To complete our review of this prior authorization request, we need\n"
+    "the following additional information:\n"
+    "%(gaps)s\n\n"
+    "## How to Submit\n\n"
+    "Please submit the requested information within 14 calendar days to\n"
+    "the utilization management department.\n\n"
+    "## Questions?\n\n"
+    "If you have questions about this request, please contact the\n"
+    "utilization management department.\n"
+)
+
+_DENIAL_LETTER = (
+    "# Prior Authorization Denial\n\n"
+    "**Date:** %(today)s\n"
+    "**Reference Number:** %(request_id)s\n\n"
+    "---\n\n"
+    "**Member Information:**\n"
+    "- Name: %(member_name)s\n"
+    "- Member ID: %(member_id)s\n\n"
+    "**Denied Service:**\n"
+    "- Description: %(service_description)s\n"
+    "- CPT Code(s): %(cpt_codes)s\n\n"
+    "---\n\n"
+    "## Denial Reason\n\n"
+    "%(justification)s\n\n"
+    "## Policy Basis\n\n"
+    "This decision is based on:\n"
+    "- Policy: %(policy_id)s — "
+    "%(policy_title)s\n"
+    "- Criteria not met: See detailed analysis in determination.json\n\n"
+    "## Appeal Rights\n\n"
+    "You have the right to appeal this decision. To appeal:\n"
+    "1. Submit a written request within 60 days of this notice\n"
+    "2. Include any additional clinical documentation supporting medical "
+    "necessity\n"
+    "3. Send to the utilization management department\n\n"
+    "## Questions?\n\n"
+    "If you have questions about this decision, please contact the\n"
+    "utilization management department.\n"
+)
+
 
 def _generate_audit_justification(assessment: dict) -> str:
     """Generate outputs/audit_justification.md per prompt module 04."""
-    member = assessment.get("request", {}).get("member", {})
-    service = assessment.get("request", {}).get("service", {})
-    provider = assessment.get("request", {}).get("provider", {})
+    request = assessment.get("request") or {}
+    member = request.get("member") or {}
+    service = request.get("service") or {}
+    provider = request.get("provider") or {}
     policy = assessment.get("policy", {})
+    mnc = policy.get("medical_necessity_check") or {}
     rec = assessment.get("recommendation", {})
     criteria = assessment.get("criteria_evaluation", [])
     clinical = assessment.get("clinical", {})
 
-    criteria_rows = ""
-    for c in criteria:
-        icon = {"MET": "✅", "NOT_MET": "❌", "INSUFFICIENT": "⚠️"}.get(c.get("status", ""), "❓")
-        evidence_text = str(c.get("evidence", "N/A"))[:100]
-        criteria_rows += (
-            f"| {icon} {c.get('status', 'N/A')} "
-            f"| {c.get('criterion', 'N/A')} "
-            f"| {evidence_text} "
-            f"| {c.get('confidence', 'N/A')}% |\n"
-        )
+    criteria_rows = "".join(
+        f"| {_STATUS_ICON.get(c.get('status', ''), '❓')} {c.get('status', 'N/A')} "
+        f"| {c.get('criterion', 'N/A')} "
+        f"| {str(c.get('evidence', 'N/A'))[:100]} "
+        f"| {c.get('confidence', 'N/A')}% |\n"
+        for c in criteria
+    )
+
+    # Findings are almost always strings already; only coerce when mixed
+    key_findings = clinical.get("key_findings") or []
+    if all(isinstance(f, str) for f in key_findings):
+        key_findings_text = ", ".join(key_findings)
+    else:
+        key_findings_text = ", ".join(map(str, key_findings))
 
     gaps_section = ""
     if rec.get("gaps"):
-        gaps_section = "### Gaps Identified\n\n"
-        for g in rec["gaps"]:
-            gaps_section += (
-                f"- **{g.get('what', 'N/A')}** — "
-                f"{g.get('request', 'N/A')} "
-                f"(Critical: {g.get('critical', False)})\n"
-            )
+        gaps_section = "### Gaps Identified\n\n" + "".join(
+            f"- **{g.get('what', 'N/A')}** — "
+            f"{g.get('request', 'N/A')} "
+            f"(Critical: {g.get('critical', False)})\n"
+            for g in rec["gaps"]
+        )
 
     return (
         "⚠️ AI-ASSISTED DRAFT - REVIEW REQUIRED\n"
@@ -1136,7 +1650,7 @@ def _generate_audit_justification(assessment: dict) -> str:
         "\n"
         "## 2. Clinical Synopsis\n\n"
         f"- **Chief Complaint:** {clinical.get('chief_complaint', 'N/A')}\n"
-        f"- **Key Findings:** {', '.join(str(f) for f in clinical.get('key_findings', [])) or 'N/A'}\n"
+        f"- **Key Findings:** {key_findings_text or 'N/A'}\n"
         f"- **Prior Treatments:** {', '.join(clinical.get('prior_treatments', [])) or 'N/A'}\n"
         f"- **ICD-10 Codes:** {', '.join(service.get('icd10_codes', []))}\n"
         f"- **Extraction Confidence:** {clinical.get('extraction_confidence', 'N/A')}%\n"
@@ -1146,8 +1660,8 @@ def _generate_audit_justification(assessment: dict) -> str:
         f"- **Policy Type:** {policy.get('policy_type', 'N/A')}\n"
         f"- **Contractor:** {policy.get('contractor', 'N/A')}\n"
         f"- **Medical Necessity:** "
-        f"{'Covered' if policy.get('medical_necessity_check', {}).get('is_covered') else 'Not Covered / Unknown'}\n"
-        f"- **Policy Basis:** {policy.get('medical_necessity_check', {}).get('policy_basis', 'N/A')}\n"
+        f"{'Covered' if mnc.get('is_covered') else 'Not Covered / Unknown'}\n"
+        f"- **Policy Basis:** {mnc.get('policy_basis', 'N/A')}\n"
         "\n"
         "### Criteria Evaluation\n\n"
         "| Status | Criterion | Evidence | Confidence |\n"
@@ -1169,41 +1683,33 @@ def _generate_determination_json(
 ) -> dict:
     """Generate outputs/determination.json per prompt module 05 schema."""
     outcome = decision.get("decision", {}).get("outcome", "PENDING")
-    determination_map = {
-        "APPROVED": "Approved",
-        "DENIED": "Rejected",
-        "PENDING": "Needs More Information",
-    }
-    status_map = {
-        "MET": "Fully Met",
-        "NOT_MET": "Not Met",
-        "INSUFFICIENT": "Partially Met",
-    }
+    policy_id = (assessment.get("policy") or {}).get("policy_id", "")
+
+    criteria_assessment = [
+        {
+            "CriterionName": c.get("criterion", ""),
+            "Assessment": _CRITERION_ASSESSMENT.get(c.get("status", ""), "Partially Met"),
+            "Evidence": c.get("evidence", ""),
+            "PolicyReference": policy_id,
+            "Notes": c.get("notes", ""),
+        }
+        for c in assessment.get("criteria_evaluation", [])
+    ]
 
-    criteria_assessment = []
-    for c in assessment.get("criteria_evaluation", []):
-        criteria_assessment.append(
+    missing_info = (
+        [
             {
-                "CriterionName": c.get("criterion", ""),
-                "Assessment": status_map.get(c.get("status", ""), "Partially Met"),
-                "Evidence": c.get("evidence", ""),
-                "PolicyReference": assessment.get("policy", {}).get("policy_id", ""),
-                "Notes": c.get("notes", ""),
+                "InformationNeeded": g.get("what", ""),
+                "Reason": g.get("request", ""),
             }
-        )
-
-    missing_info = []
-    if outcome in ("PENDING", "DENIED"):
-        for g in assessment.get("recommendation", {}).get("gaps", []):
-            missing_info.append(
-                {
-                    "InformationNeeded": g.get("what", ""),
-                    "Reason": g.get("request", ""),
-                }
-            )
+            for g in (assessment.get("recommendation") or {}).get("gaps", [])
+        ]
+        if outcome in ("PENDING", "DENIED")
+        else []
+    )
 
     return {
-        "Determination": determination_map.get(outcome, "Needs More Information"),
+        "Determination": _DETERMINATION.get(outcome, "Needs More Information"),
         "Rationale": decision.get("rationale", {}).get("summary", ""),
         "DetailedAnalysis": {
             "PolicyCriteriaAssessment": criteria_assessment,
@@ -1218,35 +1724,24 @@ def _generate_approval_letter(
     provider: dict,
     decision_block: dict,
     request_id: str,
+    letter_date: str,
 ) -> str:
     """Generate outputs/approval_letter.md."""
-    today = datetime.now(timezone.utc).strftime("%B %d, %Y")
     limitations = decision_block.get("limitations", [])
-    limitations_text = "\n".join(f"- {lim}" for lim in limitations) if limitations else "- None"
-    return (
-        "# Prior Authorization Approval\n\n"
-        f"**Date:** {today}\n"
-        f"**Authorization Number:** {decision_block.get('auth_number', 'N/A')}\n\n"
-        "---\n\n"
-        "**Member Information:**\n"
-        f"- Name: {member.get('name', 'N/A')}\n"
-        f"- Member ID: {member.get('id', 'N/A')}\n"
-        f"- Date of Birth: {member.get('dob', 'N/A')}\n\n"
-        "**Approved Service:**\n"
-        f"- Description: {service.get('description', 'N/A')}\n"
-        f"- CPT Code(s): {', '.join(service.get('cpt_codes', []))}\n"
-        f"- Provider: {provider.get('name', 'N/A')} "
-        f"(NPI: {provider.get('npi', 'N/A')})\n\n"
-        "**Authorization Period:**\n"
-        f"- Valid From: {decision_block.get('valid_from', 'N/A')}\n"
-        f"- Valid Through: {decision_block.get('valid_through', 'N/A')}\n\n"
-        f"**Limitations/Conditions:**\n{limitations_text}\n\n"
-        "---\n\n"
-        "This authorization confirms that the requested service meets medical\n"
-        "necessity criteria based on the clinical information provided.\n\n"
-        "If you have questions, please contact the utilization management "
-        "department.\n"
-    )
+    return _APPROVAL_LETTER % {
+        "today": letter_date,
+        "auth_number": decision_block.get("auth_number", "N/A"),
+        "member_name": member.get("name", "N/A"),
+        "member_id": member.get("id", "N/A"),
+        "member_dob": member.get("dob", "N/A"),
+        "service_description": service.get("description", "N/A"),
+        "cpt_codes": ", ".join(service.get("cpt_codes", [])),
+        "provider_name": provider.get("name", "N/A"),
+        "provider_npi": provider.get("npi", "N/A"),
+        "valid_from": decision_block.get("valid_from", "N/A"),
+        "valid_through": decision_block.get("valid_through", "N/A"),
+        "limitations": "\n".join(f"- {lim}" for lim in limitations) if limitations else "- None",
+    }
 
 
 def _generate_pend_letter(
@@ -1254,41 +1749,26 @@ def _generate_pend_letter(
     service: dict,
     gaps: list,
     request_id: str,
+    letter_date: str,
 ) -> str:
     """Generate outputs/pend_letter.md."""
-    today = datetime.now(timezone.utc).strftime("%B %d, %Y")
-    gaps_text = ""
-    for i, g in enumerate(gaps, 1):
-        gaps_text += (
-            f"\n{i}. **{g.get('what', 'Additional information needed')}**\n"
-            f"   - What's needed: "
-            f"{g.get('request', 'Please provide additional documentation')}\n"
-            f"   - Why it's needed: Required per applicable coverage policy "
-            f"criteria\n"
-        )
-    return (
-        "# Prior Authorization - Additional Information Required\n\n"
-        f"**Date:** {today}\n"
-        f"**Reference Number:** {request_id}\n\n"
-        "---\n\n"
-        "**Member Information:**\n"
-        f"- Name: {member.get('name', 'N/A')}\n"
-        f"- Member ID: {member.get('id', 'N/A')}\n\n"
-        "**Requested Service:**\n"
-        f"- Description: {service.get('description', 'N/A')}\n"
-        f"- CPT Code(s): {', '.join(service.get('cpt_codes', []))}\n\n"
-        "---\n\n"
-        "## Information Needed\n\n"
-        "To complete our review of this prior authorization request, we need\n"
-        "the following additional information:\n"
-        f"{gaps_text or '1. Additional clinical documentation supporting medical necessity'}\n\n"
-        "## How to Submit\n\n"
-        "Please submit the requested information within 14 calendar days to\n"
-        "the utilization management department.\n\n"
-        "## Questions?\n\n"
-        "If you have questions about this request, please contact the\n"
-        "utilization management department.\n"
+    gaps_text = "".join(
+        f"\n{i}. **{g.get('what', 'Additional information needed')}**\n"
+        f"   - What's needed: "
+        f"{g.get('request', 'Please provide additional documentation')}\n"
+        f"   - Why it's needed: Required per applicable coverage policy "
+        f"criteria\n"
+        for i, g in enumerate(gaps, 1)
     )
+    return _PEND_LETTER % {
+        "today": letter_date,
+        "request_id": request_id,
+        "member_name": member.get("name", "N/A"),
+        "member_id": member.get("id", "N/A"),
+        "service_description": service.get("description", "N/A"),
+        "cpt_codes": ", ".join(service.get("cpt_codes", [])),
+        "gaps": gaps_text or "1. Additional clinical documentation supporting medical necessity",
+    }
 
 
 def _generate_denial_letter(
@@ -1297,38 +1777,20 @@ def _generate_denial_letter(
     policy: dict,
     justification: str,
     request_id: str,
+    letter_date: str,
 ) -> str:
     """Generate outputs/denial_letter.md."""
-    today = datetime.now(timezone.utc).strftime("%B %d, %Y")
-    return (
-        "# Prior Authorization Denial\n\n"
-        f"**Date:** {today}\n"
-        f"**Reference Number:** {request_id}\n\n"
-        "---\n\n"
-        "**Member Information:**\n"
-        f"- Name: {member.get('name', 'N/A')}\n"
-        f"- Member ID: {member.get('id', 'N/A')}\n\n"
-        "**Denied Service:**\n"
-        f"- Description: {service.get('description', 'N/A')}\n"
-        f"- CPT Code(s): {', '.join(service.get('cpt_codes', []))}\n\n"
-        "---\n\n"
-        "## Denial Reason\n\n"
-        f"{justification or 'The requested service does not meet the applicable coverage criteria.'}\n\n"
-        "## Policy Basis\n\n"
-        "This decision is based on:\n"
-        f"- Policy: {policy.get('policy_id', 'N/A')} — "
-        f"{policy.get('policy_title', 'N/A')}\n"
-        "- Criteria not met: See detailed analysis in determination.json\n\n"
-        "## Appeal Rights\n\n"
-        "You have the right to appeal this decision. To appeal:\n"
-        "1. Submit a written request within 60 days of this notice\n"
-        "2. Include any additional clinical documentation supporting medical "
-        "necessity\n"
-        "3. Send to the utilization management department\n\n"
-        "## Questions?\n\n"
-        "If you have questions about this decision, please contact the\n"
-        "utilization management department.\n"
-    )
+    return _DENIAL_LETTER % {
+        "today": letter_date,
+        "request_id": request_id,
+        "member_name": member.get("name", "N/A"),
+        "member_id": member.get("id", "N/A"),
+        "service_description": service.get("description", "N/A"),
+        "cpt_codes": ", ".join(service.get("cpt_codes", [])),
+        "justification": justification or "The requested service does not meet the applicable coverage criteria.",
+        "policy_id": policy.get("policy_id", "N/A"),
+        "policy_title": policy.get("policy_title", "N/A"),
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -1336,16 +1798,24 @@ def _generate_denial_letter(
 # ---------------------------------------------------------------------------
 
 
-def _check_compliance_gate(compliance_text: str) -> bool:
-    """Parse compliance output to determine if we can proceed."""
-    lower = compliance_text.lower()
-    if '"can_proceed_to_clinical_review": true' in lower:
-        return True
-    if '"compliance_status": "pass"' in lower:
+def _check_compliance_gate(compliance_parsed: dict | None, compliance_text: str) -> bool:
+    """Determine if we can proceed from the compliance output.
+
+    Reads the already-parsed JSON fields; the raw text is only scanned
+    when the agent reply could not be parsed into them.
+    """
+    if compliance_parsed:
+        can_proceed = compliance_parsed.get("can_proceed_to_clinical_review")
+        status = str(compliance_parsed.get("compliance_status", "")).lower()
+        if can_proceed is True or status == "pass":
+            return True
+        if can_proceed is False or status == "fail":
+            return False
+    verdicts = {(m.group(1) or m.group(2)).lower() for m in _COMPLIANCE_GATE_RE.finditer(compliance_text)}
+    # Any explicit true/pass wins over false/fail, wherever each appears
+    if verdicts & {"true", "pass"}:
         return True
-    if '"can_proceed_to_clinical_review": false' in lower:
-        return False
-    if '"compliance_status": "fail"' in lower:
+    if verdicts:
         return False
     logger.warning("Could not parse compliance gate — defaulting to proceed")
     return True
@@ -13,17 +13,23 @@ Uses:
 Supports MCP Protocol 2025-06-18 with Streamable HTTP transport for APIM integration.
 """
 
-import json
+import asyncio
+import hashlib
 import logging
 import os
+import re
+import time
 import uuid
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 from urllib.parse import urlparse
 
 import azure.functions as func
-from azure.cosmos.aio import CosmosClient
+import orjson
+from azure.core.credentials import AccessToken
+from azure.cosmos.aio import ContainerProxy, CosmosClient
 from azure.identity.aio import DefaultAzureCredential
 from openai import AsyncAzureOpenAI
 
@@ -42,6 +48,8 @@ COSMOS_DB_DATABASE = os.environ.get("COSMOS_DB_DATABASE", "healthcare-mcp")
 AI_SERVICES_ENDPOINT = os.environ.get("AZURE_AI_SERVICES_ENDPOINT", "")
 EMBEDDING_DEPLOYMENT = os.environ.get("EMBEDDING_DEPLOYMENT_NAME", "text-embedding-3-large")
 EMBEDDING_DIMENSIONS = int(os.environ.get("EMBEDDING_DIMENSIONS", "3072"))
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+TOKEN_REFRESH_MARGIN_SECONDS = 300
 
 # Container names (must match Bicep definitions in dependent-resources.bicep)
 DOCUMENTS_CONTAINER = "documents"
@@ -52,6 +60,33 @@ AGENT_MEMORY_CONTAINER = "agent-memory"
 DEFAULT_CHUNK_SIZE = 1000  # characters
 DEFAULT_CHUNK_OVERLAP = 200  # characters
 
+# Inputs per embeddings request when indexing (API limit is 2048)
+EMBEDDING_BATCH_SIZE = 96
+# Recently embedded chunk texts, keyed by content hash, so re-indexing an
+# unchanged document skips the embeddings API (a 3072-dim vector held as a
+# Python list of floats takes ~100 KB of memory)
+EMBEDDING_CACHE_SIZE = 256
+# Transactional batch limits. Cosmos caps a batch at 100 operations and a 2 MB
+# request; batches are filled by each item's serialized size, with headroom
+# for the batch envelope. A 3072-dim embedding serializes to ~64 KB of JSON,
+# so default-size chunks fill a batch by count, while large chunk_size values
+# get smaller batches instead of an oversized request.
+INDEX_BATCH_SIZE = 25
+INDEX_BATCH_MAX_BYTES = 1536 * 1024
+# Concurrent batches per indexed document (caps RU burst)
+INDEX_BATCH_CONCURRENCY = 4
+# Identical searches (agent retries, UI re-renders) within this window reuse
+# the previous result; any index_document call invalidates them
+SEARCH_CACHE_TTL = 300.0  # seconds
+SEARCH_CACHE_SIZE = 1024
+# Audit events for the same workflow that arrive together are written as one
+# transactional batch (events are small; this stays well under the 2 MB cap)
+AUDIT_BATCH_SIZE = 50
+
+# A sentence runs up to and including the next terminator; trailing text
+# without one is the final sentence.
+_SENTENCE_RE = re.compile(r"[^.!?\n]*[.!?\n]|[^.!?\n]+\Z")
+
 
 # ============================================================================
 # Cosmos DB & Embedding Clients (lazy-initialized)
@@ -60,6 +95,13 @@ DEFAULT_CHUNK_OVERLAP = 200  # characters
 _credential: DefaultAzureCredential | None = None
 _cosmos_client: CosmosClient | None = None
 _openai_client: AsyncAzureOpenAI | None = None
+_openai_token: AccessToken | None = None
+_embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
+_containers: dict[str, ContainerProxy] = {}
+_search_cache: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+_index_version = 0
+_audit_pending: dict[str, list[tuple[dict, asyncio.Future]]] = {}
+_audit_flush_tasks: set[asyncio.Task] = set()
 
 
 def normalize_endpoint(raw_endpoint: str, env_var_name: str) -> str:
@@ -87,7 +129,11 @@ async def get_credential() -> DefaultAzureCredential:
 
 
 async def get_cosmos_client() -> CosmosClient:
-    """Get or create Cosmos DB client using managed identity."""
+    """Get or create Cosmos DB client using managed identity.
+
+    The client is shared for the life of the worker so its aiohttp session
+    keeps connections (and their TLS sessions) alive across queries.
+    """
     global _cosmos_client
     if _cosmos_client is None:
         credential = await get_credential()
@@ -106,21 +152,31 @@ async def get_openai_client() -> AsyncAzureOpenAI:
             "AZURE_AI_SERVICES_ENDPOINT (or AZURE_OPENAI_ENDPOINT fallback)",
         )
 
-        credential = await get_credential()
-        token = await credential.get_token("https://cognitiveservices.azure.com/.default")
         _openai_client = AsyncAzureOpenAI(
             azure_endpoint=ai_endpoint,
             api_version="2024-10-21",
-            azure_ad_token=token.token,
+            azure_ad_token_provider=get_openai_token,
         )
     return _openai_client
 
 
-async def get_container(container_name: str):
-    """Get a Cosmos DB container client."""
-    client = await get_cosmos_client()
-    database = client.get_database_client(COSMOS_DB_DATABASE)
-    return database.get_container_client(container_name)
+async def get_openai_token() -> str:
+    """Return a cached Azure OpenAI bearer token, refreshed shortly before it expires."""
+    global _openai_token
+    if _openai_token is None or _openai_token.expires_on - time.time() < TOKEN_REFRESH_MARGIN_SECONDS:
+        credential = await get_credential()
+        _openai_token = await credential.get_token(COGNITIVE_SERVICES_SCOPE)
+    return _openai_token.token
+
+
+async def get_container(container_name: str) -> ContainerProxy:
+    """Get a Cosmos DB container client (cached per container for the worker's lifetime)."""
+    container = _containers.get(container_name)
+    if container is None:
+        client = await get_cosmos_client()
+        database = client.get_database_client(COSMOS_DB_DATABASE)
+        container = _containers[container_name] = database.get_container_client(container_name)
+    return container
 
 
 async def generate_embedding(text: str) -> list[float]:
@@ -134,6 +190,68 @@ async def generate_embedding(text: str) -> list[float]:
     return response.data[0].embedding
 
 
+def content_hash(text: str) -> str:
+    """SHA-256 hex digest identifying a chunk's text."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+async def generate_embeddings(texts: list[str], hashes: list[str] | None = None) -> list[list[float]]:
+    """Generate embedding vectors for many texts, EMBEDDING_BATCH_SIZE inputs per request.
+
+    Texts already in the content-hash cache (or repeated within ``texts``)
+    are not sent to the API. Pass ``hashes`` if the caller already has them.
+    """
+    if hashes is None:
+        hashes = [content_hash(text) for text in texts]
+
+    vectors: dict[str, list[float]] = {}
+    pending: dict[str, str] = {}
+    for key, text in zip(hashes, texts):
+        cached = _embedding_cache.get(key)
+        if cached is not None:
+            _embedding_cache.move_to_end(key)
+            vectors[key] = cached
+        else:
+            pending.setdefault(key, text)
+
+    if pending:
+        client = await get_openai_client()
+        pending_keys = list(pending)
+        pending_texts = list(pending.values())
+        for start in range(0, len(pending_texts), EMBEDDING_BATCH_SIZE):
+            response = await client.embeddings.create(
+                input=pending_texts[start : start + EMBEDDING_BATCH_SIZE],
+                model=EMBEDDING_DEPLOYMENT,
+                dimensions=EMBEDDING_DIMENSIONS,
+            )
+            # Results carry their input index; don't rely on response order
+            for d in response.data:
+                key = pending_keys[start + d.index]
+                vectors[key] = d.embedding
+                _embedding_cache[key] = d.embedding
+                if len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+                    _embedding_cache.popitem(last=False)
+
+    return [vectors[key] for key in hashes]
+
+
+# ============================================================================
+# Argument Validation
+# ============================================================================
+
+
+class InvalidParamsError(ValueError):
+    """A tool argument has the wrong type; reported as JSON-RPC -32602."""
+
+
+def int_arg(args: dict, name: str, default: int, upper: int) -> int:
+    """Read an integer tool argument, clamped to the range 1..upper."""
+    value = args.get(name, default)
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise InvalidParamsError(f"{name} must be an integer")
+    return max(1, min(value, upper))
+
+
 # ============================================================================
 # Text Chunking
 # ============================================================================
@@ -145,15 +263,7 @@ def chunk_text(text: str, chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = D
         return [text]
 
     # Split on sentence boundaries
-    sentences = []
-    current = ""
-    for char in text:
-        current += char
-        if char in ".!?\n" and len(current.strip()) > 0:
-            sentences.append(current.strip())
-            current = ""
-    if current.strip():
-        sentences.append(current.strip())
+    sentences = [part for part in (m.group().strip() for m in _SENTENCE_RE.finditer(text)) if part]
 
     chunks = []
     current_chunk = ""
@@ -161,14 +271,17 @@ def chunk_text(text: str, chunk_size: int = DEFAULT_CHUNK_SIZE, overlap: int = D
     for sentence in sentences:
         if len(current_chunk) + len(sentence) + 1 > chunk_size and current_chunk:
             chunks.append(current_chunk.strip())
-            # Keep overlap from end of current chunk
+            # Keep overlap from end of current chunk: count how many trailing
+            # words fit, then join them once
             words = current_chunk.split()
-            overlap_text = ""
+            kept = 0
+            overlap_len = 0
             for word in reversed(words):
-                if len(overlap_text) + len(word) + 1 > overlap:
+                overlap_len += len(word) + 1
+                if overlap_len > overlap:
                     break
-                overlap_text = word + " " + overlap_text
-            current_chunk = overlap_text.strip() + " " + sentence
+                kept += 1
+            current_chunk = " ".join(words[len(words) - kept :]) + " " + sentence
         else:
             current_chunk = (current_chunk + " " + sentence).strip()
 
@@ -404,14 +517,94 @@ class CosmosRAGServer:
 
 server = CosmosRAGServer()
 
+# Tool schemas never change at runtime, so serialize the discovery document
+# and the tools/list result once at import instead of on every request.
+_DISCOVERY_BODY = orjson.dumps(server.get_discovery_response())
+_TOOLS_LIST_RESULT = orjson.dumps({"tools": server.get_tools()})
+_TRANSPORT_BODY = orjson.dumps(
+    {
+        "name": server.name,
+        "version": server.version,
+        "protocol_version": MCP_PROTOCOL_VERSION,
+        "transport": "streamable-http",
+        "endpoint": "/mcp",
+        "methods_supported": ["POST"],
+    }
+)
+_INITIALIZE_RESULT = {
+    "protocolVersion": MCP_PROTOCOL_VERSION,
+    "serverInfo": {"name": server.name, "version": server.version},
+    "capabilities": {"tools": {"listChanged": False}},
+}
+
+# JSON-RPC error envelope; only the id and message vary per response
+_ERROR_TEMPLATE = b'{"jsonrpc":"2.0","id":%s,"error":{"code":%d,"message":%s}}'
+_PARSE_ERROR_BODY = _ERROR_TEMPLATE % (b"null", -32700, b'"Parse error"')
+_SSE_NOT_SUPPORTED_BODY = _ERROR_TEMPLATE % (
+    b"null",
+    -32600,
+    b'"SSE transport not supported. Use POST for Streamable HTTP transport."',
+)
+
+
+def _error_body(msg_id, code: int, message: str) -> bytes:
+    """Render a JSON-RPC error response from the pre-serialized envelope."""
+    return _ERROR_TEMPLATE % (orjson.dumps(msg_id), code, orjson.dumps(message))
+
 
 # ============================================================================
 # Tool Handlers
 # ============================================================================
 
 
+def _search_cache_key(search_type: str, args: dict) -> tuple:
+    """Cache key for a search call; includes the index version so new documents invalidate it."""
+    return (search_type, _index_version, orjson.dumps(args, option=orjson.OPT_SORT_KEYS))
+
+
+def _get_cached_search(key: tuple) -> dict | None:
+    """Return a cached search result if it is still fresh."""
+    entry = _search_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del _search_cache[key]
+        return None
+    _search_cache.move_to_end(key)
+    return entry[1]
+
+
+def _cache_search(key: tuple, result: dict) -> None:
+    """Store a search result, evicting the least recently used entry when full."""
+    _search_cache[key] = (time.monotonic() + SEARCH_CACHE_TTL, result)
+    _search_cache.move_to_end(key)
+    if len(_search_cache) > SEARCH_CACHE_SIZE:
+        _search_cache.popitem(last=False)
+
+
+def _index_batches(items: list[dict]) -> list[list[dict]]:
+    """Group chunk items, in order, into batches under both Cosmos batch limits.
+
+    An item too large to share a batch is sent on its own.
+    """
+    batches: list[list[dict]] = []
+    batch: list[dict] = []
+    batch_bytes = 0
+    for item in items:
+        size = len(orjson.dumps(item))
+        if batch and (len(batch) >= INDEX_BATCH_SIZE or batch_bytes + size > INDEX_BATCH_MAX_BYTES):
+            batches.append(batch)
+            batch, batch_bytes = [], 0
+        batch.append(item)
+        batch_bytes += size
+    if batch:
+        batches.append(batch)
+    return batches
+
+
 async def index_document(args: dict) -> dict:
     """Index a document: chunk, embed, and upsert into Cosmos DB documents container."""
+    global _index_version
     title = args["title"]
     content = args["content"]
     category = args["category"]
@@ -423,33 +616,52 @@ async def index_document(args: dict) -> dict:
     chunks = chunk_text(content, chunk_size, chunk_overlap)
 
     container = await get_container(DOCUMENTS_CONTAINER)
-    indexed_chunks = []
-
-    for i, chunk in enumerate(chunks):
-        chunk_id = f"{doc_id}-chunk-{i}"
-        embedding = await generate_embedding(chunk)
+    hashes = [content_hash(chunk) for chunk in chunks]
+    embeddings = await generate_embeddings(chunks, hashes)
+    indexed_at = datetime.now(timezone.utc).isoformat()
 
-        item = {
-            "id": chunk_id,
+    items = [
+        {
+            "id": f"{doc_id}-chunk-{i}",
             "documentId": doc_id,
             "category": category,
             "title": title,
             "content": chunk,
+            "contentHash": digest,
             "embedding": embedding,
             "chunkIndex": i,
             "totalChunks": len(chunks),
             "metadata": metadata,
-            "indexedAt": datetime.now(timezone.utc).isoformat(),
+            "indexedAt": indexed_at,
         }
+        for i, (chunk, digest, embedding) in enumerate(zip(chunks, hashes, embeddings))
+    ]
 
-        await container.upsert_item(item)
-        indexed_chunks.append(
-            {
-                "chunkId": chunk_id,
-                "chunkIndex": i,
-                "contentLength": len(chunk),
-            }
-        )
+    # All chunks share the category partition key, so they can be written as
+    # transactional batches (see _index_batches). Batches run concurrently,
+    # bounded so a large document doesn't spike RU consumption.
+    semaphore = asyncio.Semaphore(INDEX_BATCH_CONCURRENCY)
+
+    async def _upsert_batch(batch: list[dict]) -> None:
+        async with semaphore:
+            await container.execute_item_batch(
+                [("upsert", (item,)) for item in batch],
+                partition_key=category,
+            )
+
+    await asyncio.gather(*map(_upsert_batch, _index_batches(items)))
+
+    # New content changes search results; retire every cached search
+    _index_version += 1
+
+    indexed_chunks = [
+        {
+            "chunkId": item["id"],
+            "chunkIndex": item["chunkIndex"],
+            "contentLength": len(item["content"]),
+        }
+        for item in items
+    ]
 
     return {
         "documentId": doc_id,
@@ -463,20 +675,27 @@ async def index_document(args: dict) -> dict:
 
 async def hybrid_search(args: dict) -> dict:
     """Hybrid search: vector (DiskANN) + BM25 full-text with RRF fusion."""
+    cache_key = _search_cache_key("hybrid", args)
+    cached = _get_cached_search(cache_key)
+    if cached is not None:
+        return cached
+
     query_text = args["query"]
     category = args.get("category")
-    top_k = min(args.get("top_k", 5), 20)
+    top_k = int_arg(args, "top_k", 5, 20)
 
     query_embedding = await generate_embedding(query_text)
     container = await get_container(DOCUMENTS_CONTAINER)
 
-    # Build parameterized hybrid query with RRF
+    # Build parameterized hybrid query with RRF. The query vector is bound as
+    # a parameter rather than inlined as ~60 KB of SQL literal.
     # Cosmos DB NoSQL hybrid search: ORDER BY RANK RRF(VectorDistance, FullTextScore)
     where_clause = "WHERE c.category = @category" if category else ""
     params: list[dict[str, Any]] = []
     if category:
         params.append({"name": "@category", "value": category})
     params.append({"name": "@topK", "value": top_k})
+    params.append({"name": "@queryVector", "value": query_embedding})
 
     query = f"""
         SELECT TOP @topK
@@ -492,7 +711,7 @@ async def hybrid_search(args: dict) -> dict:
         FROM c
         {where_clause}
         ORDER BY RANK RRF(
-            VectorDistance(c.embedding, {json.dumps(query_embedding)}),
+            VectorDistance(c.embedding, @queryVector),
             FullTextScore(c.content, ['{query_text.replace("'", "''")}'])
         )
     """
@@ -515,20 +734,29 @@ async def hybrid_search(args: dict) -> dict:
                 "metadata": item.get("metadata", {}),
             }
         )
+        if len(results) >= top_k:
+            break  # TOP is satisfied; skip the pager's trailing page fetch
 
-    return {
+    result = {
         "query": query_text,
         "searchType": "hybrid",
         "resultCount": len(results),
         "results": results,
     }
+    _cache_search(cache_key, result)
+    return result
 
 
 async def vector_search(args: dict) -> dict:
     """Pure vector similarity search using DiskANN index."""
+    cache_key = _search_cache_key("vector", args)
+    cached = _get_cached_search(cache_key)
+    if cached is not None:
+        return cached
+
     query_text = args["query"]
     category = args.get("category")
-    top_k = min(args.get("top_k", 5), 20)
+    top_k = int_arg(args, "top_k", 5, 20)
 
     query_embedding = await generate_embedding(query_text)
     container = await get_container(DOCUMENTS_CONTAINER)
@@ -538,6 +766,7 @@ async def vector_search(args: dict) -> dict:
     if category:
         params.append({"name": "@category", "value": category})
     params.append({"name": "@topK", "value": top_k})
+    params.append({"name": "@queryVector", "value": query_embedding})
 
     query = f"""
         SELECT TOP @topK
@@ -550,10 +779,10 @@ async def vector_search(args: dict) -> dict:
             c.totalChunks,
             c.metadata,
             c.indexedAt,
-            VectorDistance(c.embedding, {json.dumps(query_embedding)}) AS score
+            VectorDistance(c.embedding, @queryVector) AS score
         FROM c
         {where_clause}
-        ORDER BY VectorDistance(c.embedding, {json.dumps(query_embedding)})
+        ORDER BY VectorDistance(c.embedding, @queryVector)
     """
 
     results = []
@@ -575,13 +804,37 @@ async def vector_search(args: dict) -> dict:
                 "score": item.get("score"),
             }
         )
+        if len(results) >= top_k:
+            break
 
-    return {
+    result = {
         "query": query_text,
         "searchType": "vector",
         "resultCount": len(results),
         "results": results,
     }
+    _cache_search(cache_key, result)
+    return result
+
+
+async def _flush_audit_events(workflow_id: str) -> None:
+    """Write every audit event queued for a workflow, resolving each caller's future."""
+    pending = _audit_pending.pop(workflow_id)
+    try:
+        container = await get_container(AUDIT_TRAIL_CONTAINER)
+        for start in range(0, len(pending), AUDIT_BATCH_SIZE):
+            batch = pending[start : start + AUDIT_BATCH_SIZE]
+            await container.execute_item_batch(
+                [("create", (event,)) for event, _ in batch],
+                partition_key=workflow_id,
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+    except Exception as e:
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(e)
 
 
 async def record_audit_event(args: dict) -> dict:
@@ -603,8 +856,19 @@ async def record_audit_event(args: dict) -> dict:
         "details": args.get("details", {}),
     }
 
-    container = await get_container(AUDIT_TRAIL_CONTAINER)
-    await container.create_item(event)
+    # Group commit: the first event for a workflow schedules a flush, and any
+    # events for the same workflow queued before it runs join its batch. The
+    # caller still waits for the write, so "recorded" always means persisted.
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    pending = _audit_pending.get(event["workflowId"])
+    if pending is None:
+        pending = _audit_pending[event["workflowId"]] = []
+        task = loop.create_task(_flush_audit_events(event["workflowId"]))
+        _audit_flush_tasks.add(task)
+        task.add_done_callback(_audit_flush_tasks.discard)
+    pending.append((event, future))
+    await future
 
     return {
         "eventId": event_id,
@@ -618,7 +882,7 @@ async def get_audit_trail(args: dict) -> dict:
     """Query audit trail by workflow ID, ordered by timestamp."""
     workflow_id = args["workflow_id"]
     phase = args.get("phase")
-    limit = min(args.get("limit", 50), 200)
+    limit = int_arg(args, "limit", 50, 200)
 
     container = await get_container(AUDIT_TRAIL_CONTAINER)
 
@@ -631,8 +895,12 @@ async def get_audit_trail(args: dict) -> dict:
         params.append({"name": "@phase", "value": phase})
 
     where = " AND ".join(conditions)
+    # Single-partition query — audit-trail is partitioned on /workflowId.
+    # ORDER BY leads with the filtered workflowId so the composite index on
+    # (workflowId, timestamp) serves the sort.
     query = f"""
-        SELECT TOP {limit} *
+        SELECT TOP {limit} c.id, c.workflowId, c.workflowType, c.phase, c.agentName,
+            c.action, c.status, c.timestamp, c.inputSummary, c.outputSummary, c.details
         FROM c
         WHERE {where}
         ORDER BY c.workflowId ASC, c.timestamp ASC
@@ -660,6 +928,8 @@ async def get_audit_trail(args: dict) -> dict:
                 "details": item.get("details", {}),
             }
         )
+        if len(events) >= limit:
+            break
 
     return {
         "workflowId": workflow_id,
@@ -674,7 +944,7 @@ async def get_session_history(args: dict) -> dict:
     start_date = args.get("start_date")
     end_date = args.get("end_date")
     status_filter = args.get("status")
-    limit = min(args.get("limit", 25), 100)
+    limit = int_arg(args, "limit", 25, 100)
 
     container = await get_container(AUDIT_TRAIL_CONTAINER)
 
@@ -694,9 +964,12 @@ async def get_session_history(args: dict) -> dict:
         params.append({"name": "@status", "value": status_filter})
 
     where = " AND ".join(conditions)
-    # Cross-partition query — uses composite index on (workflowType, timestamp DESC)
+    # Cross-partition query — uses composite index on (workflowType, timestamp DESC),
+    # which requires the filtered workflowType to stay in the ORDER BY
+    # details is not returned here, so it is left out of the projection
     query = f"""
-        SELECT TOP {limit} *
+        SELECT TOP {limit} c.id, c.workflowId, c.workflowType, c.phase, c.agentName,
+            c.action, c.status, c.timestamp, c.inputSummary, c.outputSummary
         FROM c
         WHERE {where}
         ORDER BY c.workflowType ASC, c.timestamp DESC
@@ -722,6 +995,8 @@ async def get_session_history(args: dict) -> dict:
                 "outputSummary": item.get("outputSummary"),
             }
         )
+        if len(events) >= limit:
+            break
 
     return {
         "workflowType": workflow_type,
@@ -743,6 +1018,10 @@ TOOL_HANDLERS = {
     "get_session_history": get_session_history,
 }
 
+# Required arguments per tool, read once from the input schemas so a malformed
+# call is rejected before it reaches the embeddings API or Cosmos DB
+TOOL_REQUIRED_ARGS = {tool["name"]: tuple(tool["inputSchema"].get("required", ())) for tool in server.get_tools()}
+
 
 # ============================================================================
 # Azure Function Endpoints
@@ -753,7 +1032,7 @@ TOOL_HANDLERS = {
 async def mcp_discovery(req: func.HttpRequest) -> func.HttpResponse:
     """MCP Discovery endpoint - returns server capabilities and tools."""
     return func.HttpResponse(
-        json.dumps(server.get_discovery_response()),
+        _DISCOVERY_BODY,
         mimetype="application/json",
         headers={
             "X-MCP-Protocol-Version": MCP_PROTOCOL_VERSION,
@@ -770,16 +1049,7 @@ async def mcp_get(req: func.HttpRequest) -> func.HttpResponse:
     accept = req.headers.get("Accept", "")
     if "text/event-stream" in accept:
         return func.HttpResponse(
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32600,
-                        "message": "SSE transport not supported. Use POST for Streamable HTTP transport.",
-                    },
-                    "id": None,
-                }
-            ),
+            _SSE_NOT_SUPPORTED_BODY,
             status_code=405,
             mimetype="application/json",
             headers={
@@ -790,16 +1060,7 @@ async def mcp_get(req: func.HttpRequest) -> func.HttpResponse:
         )
 
     return func.HttpResponse(
-        json.dumps(
-            {
-                "name": server.name,
-                "version": server.version,
-                "protocol_version": MCP_PROTOCOL_VERSION,
-                "transport": "streamable-http",
-                "endpoint": "/mcp",
-                "methods_supported": ["POST"],
-            }
-        ),
+        _TRANSPORT_BODY,
         mimetype="application/json",
         headers={
             "X-MCP-Protocol-Version": MCP_PROTOCOL_VERSION,
@@ -814,16 +1075,10 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
     session_id = req.headers.get("Mcp-Session-Id", str(uuid.uuid4()))
 
     try:
-        body = req.get_json()
+        body = orjson.loads(req.get_body())
     except ValueError:
         return func.HttpResponse(
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {"code": -32700, "message": "Parse error"},
-                }
-            ),
+            _PARSE_ERROR_BODY,
             status_code=400,
             mimetype="application/json",
         )
@@ -834,14 +1089,18 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
 
     try:
         if method == "initialize":
-            result = {
-                "protocolVersion": MCP_PROTOCOL_VERSION,
-                "serverInfo": {"name": server.name, "version": server.version},
-                "capabilities": {"tools": {"listChanged": False}},
-            }
+            result = _INITIALIZE_RESULT
 
         elif method == "tools/list":
-            result = {"tools": server.get_tools()}
+            return func.HttpResponse(
+                b'{"jsonrpc":"2.0","id":' + orjson.dumps(msg_id) + b',"result":' + _TOOLS_LIST_RESULT + b"}",
+                mimetype="application/json",
+                headers={
+                    "X-MCP-Protocol-Version": MCP_PROTOCOL_VERSION,
+                    "Mcp-Session-Id": session_id,
+                    "Cache-Control": "no-cache",
+                },
+            )
 
         elif method == "tools/call":
             tool_name = params.get("name")
@@ -850,19 +1109,33 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
             handler = TOOL_HANDLERS.get(tool_name)
             if not handler:
                 return func.HttpResponse(
-                    json.dumps(
-                        {
-                            "jsonrpc": "2.0",
-                            "id": msg_id,
-                            "error": {"code": -32602, "message": f"Unknown tool: {tool_name}"},
-                        }
-                    ),
+                    _error_body(msg_id, -32602, f"Unknown tool: {tool_name}"),
                     mimetype="application/json",
                 )
 
-            tool_result = await handler(tool_args)
+            if not isinstance(tool_args, dict):
+                return func.HttpResponse(
+                    _error_body(msg_id, -32602, "Tool arguments must be an object"),
+                    mimetype="application/json",
+                )
+
+            missing = [name for name in TOOL_REQUIRED_ARGS[tool_name] if name not in tool_args]
+            if missing:
+                return func.HttpResponse(
+                    _error_body(msg_id, -32602, f"Missing required arguments: {', '.join(missing)}"),
+                    mimetype="application/json",
+                )
+
+            try:
+                tool_result = await handler(tool_args)
+            except InvalidParamsError as e:
+                return func.HttpResponse(
+                    _error_body(msg_id, -32602, str(e)),
+                    mimetype="application/json",
+                )
+            tool_text = orjson.dumps(tool_result, option=orjson.OPT_NON_STR_KEYS).decode()
             result = {
-                "content": [{"type": "text", "text": json.dumps(tool_result)}],
+                "content": [{"type": "text", "text": tool_text}],
             }
 
         elif method == "ping":
@@ -870,18 +1143,12 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
 
         else:
             return func.HttpResponse(
-                json.dumps(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "error": {"code": -32601, "message": f"Method not found: {method}"},
-                    }
-                ),
+                _error_body(msg_id, -32601, f"Method not found: {method}"),
                 mimetype="application/json",
             )
 
         return func.HttpResponse(
-            json.dumps({"jsonrpc": "2.0", "id": msg_id, "result": result}),
+            orjson.dumps({"jsonrpc": "2.0", "id": msg_id, "result": result}),
             mimetype="application/json",
             headers={
                 "X-MCP-Protocol-Version": MCP_PROTOCOL_VERSION,
@@ -893,13 +1160,7 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
     except Exception as e:
         logger.exception("Error handling MCP message")
         return func.HttpResponse(
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "id": msg_id,
-                    "error": {"code": -32603, "message": f"Internal error: {e!s}"},
-                }
-            ),
+            _error_body(msg_id, -32603, f"Internal error: {e!s}"),
             status_code=500,
             mimetype="application/json",
             headers={"Mcp-Session-Id": session_id},
@@ -923,7 +1184,7 @@ async def health_check(req: func.HttpRequest) -> func.HttpResponse:
 
     status_code = 200 if health["status"] == "healthy" else 503
     return func.HttpResponse(
-        json.dumps(health),
+        orjson.dumps(health),
         mimetype="application/json",
         status_code=status_code,
     )
@@ -13,9 +13,13 @@ from __future__ import annotations
 import base64
 import csv
 import hashlib
+import io
 import json
 import mimetypes
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
@@ -43,6 +47,13 @@ class ReadOptions:
     # Convenience for UI/LLM "image_url" usage.
     include_data_url: bool = False
 
+    # If false, binary results carry the raw bytes under "data" instead of
+    # "base64". Not JSON-serializable; for callers that serve the bytes themselves.
+    encode_binary: bool = True
+
+    # Reuse the result of an identical earlier read of the unchanged file.
+    cache: bool = True
+
 
 TEXT_EXTS = {
     ".txt",
@@ -59,6 +70,11 @@ TEXT_EXTS = {
 
 STRUCTURED_EXTS = {".json", ".csv", ".tsv", ".ndjson"}
 
+# Binary reads hash and base64-encode the file in chunks of this size. A
+# multiple of 3 bytes encodes without padding, so the chunk encodings
+# concatenate to the encoding of the whole file.
+BINARY_READ_CHUNK = 3 * 65536
+
 BINARY_EXTS = {
     ".pdf",
     ".png",
@@ -72,6 +88,25 @@ BINARY_EXTS = {
     ".heic",
 }
 
+# Mode chosen by extension in auto mode; other extensions fall back to the mime type.
+AUTO_MODE_BY_EXT = {ext: "text" for ext in TEXT_EXTS | STRUCTURED_EXTS}
+AUTO_MODE_BY_EXT.update({ext: "binary" for ext in BINARY_EXTS})
+
+
+# Recent successful reads, keyed by (path, mtime_ns, size, options); a changed
+# file gets a new key. Bounded by entry count and by the approximate size of
+# the cached results (see _result_size), stored alongside each one.
+READ_CACHE_MAX_ENTRIES = 64
+READ_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_read_cache: OrderedDict[tuple, tuple[dict[str, Any], int]] = OrderedDict()
+_read_cache_bytes = 0
+_read_cache_lock = threading.Lock()
+
+# Shared decoder for per-line NDJSON parsing; skips json.loads' per-call
+# argument handling on every line.
+_decode_json = json.JSONDecoder().decode
+
 
 def _is_within(root: Path, path: Path) -> bool:
     try:
@@ -130,20 +165,60 @@ def read_document(path: str, *, workspace_root: Path, options: ReadOptions | Non
             "workspace_root": str(workspace_root),
         }
 
+    st = p.stat()
+    key = (str(p), st.st_mtime_ns, st.st_size, opts)
+    if opts.cache:
+        with _read_cache_lock:
+            cached = _read_cache.get(key)
+            if cached is not None:
+                _read_cache.move_to_end(key)
+                return dict(cached[0])
+
+    result = _read_file(p, st.st_size, opts)
+    if opts.cache and result["ok"]:
+        _cache_read(key, result)
+    # Shallow copy so callers can edit top-level keys without touching the cache
+    return dict(result)
+
+
+def _result_size(result: dict[str, Any]) -> int:
+    """Approximate memory held by a read result.
+
+    Counts its text, base64, data_url and raw data; parsed json/rows/items
+    are charged as one more copy of the text they came from.
+    """
+    size = sum(len(value) for value in result.values() if isinstance(value, (str, bytes)))
+    if "json" in result or "rows" in result or "items" in result:
+        size += len(result["text"])
+    return size
+
+
+def _cache_read(key: tuple, result: dict[str, Any]) -> None:
+    global _read_cache_bytes
+    size = _result_size(result)
+    if size > READ_CACHE_MAX_BYTES:
+        return
+    with _read_cache_lock:
+        if key in _read_cache:
+            return
+        _read_cache[key] = (result, size)
+        _read_cache_bytes += size
+        while len(_read_cache) > READ_CACHE_MAX_ENTRIES or _read_cache_bytes > READ_CACHE_MAX_BYTES:
+            _, (_, evicted_size) = _read_cache.popitem(last=False)
+            _read_cache_bytes -= evicted_size
+
+
+def _read_file(p: Path, size_bytes: int, opts: ReadOptions) -> dict[str, Any]:
     ext = p.suffix.lower()
     mime = _guess_mime(p)
-    size_bytes = p.stat().st_size
 
     # Decide mode in auto.
     mode = (opts.mode or "auto").lower()
     if mode == "auto":
-        if ext in TEXT_EXTS or ext in STRUCTURED_EXTS:
-            mode = "text"
-        elif ext in BINARY_EXTS:
-            mode = "binary"
-        else:
+        mode = AUTO_MODE_BY_EXT.get(ext)
+        if mode is None:
             # default unknowns to text if mime suggests it
-            mode = "text" if (mime.startswith("text/") or mime in {"application/json"}) else "binary"
+            mode = "text" if (mime.startswith("text/") or mime == "application/json") else "binary"
 
     if mode == "binary":
         if size_bytes > opts.max_bytes:
@@ -155,18 +230,28 @@ def read_document(path: str, *, workspace_root: Path, options: ReadOptions | Non
                 "max_bytes": opts.max_bytes,
             }
 
-        data = p.read_bytes()
-        digest = hashlib.sha256(data).hexdigest()
-        b64 = base64.b64encode(data).decode("ascii")
+        # Single streaming pass; when encoding, only one chunk of raw bytes is
+        # held at a time.
+        sha = hashlib.sha256()
+        parts: list[Any] = []
+        with p.open("rb") as f:
+            while chunk := f.read(BINARY_READ_CHUNK):
+                sha.update(chunk)
+                parts.append(base64.b64encode(chunk).decode("ascii") if opts.encode_binary else chunk)
         result: dict[str, Any] = {
             "ok": True,
             "path": str(p),
             "kind": "binary",
             "mime": mime,
             "size_bytes": size_bytes,
-            "sha256": digest,
-            "base64": b64,
+            "sha256": sha.hexdigest(),
         }
+        if not opts.encode_binary:
+            result["data"] = b"".join(parts)
+            return result
+
+        b64 = "".join(parts)
+        result["base64"] = b64
         if opts.include_data_url:
             result["data_url"] = f"data:{mime};base64,{b64}"
         return result
@@ -208,28 +293,20 @@ def read_document(path: str, *, workspace_root: Path, options: ReadOptions | Non
             # Leave as plain text on parse failure.
             result["kind"] = "text"
     elif ext == ".ndjson":
-        items: list[Any] = []
-        for line in text.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                items.append(json.loads(line))
-            except Exception:
-                # If any line fails, don't partially parse; return raw text.
-                items = []
-                break
+        try:
+            items: list[Any] = [_decode_json(line) for line in map(str.strip, text.splitlines()) if line]
+        except Exception:
+            # If any line fails, don't partially parse; return raw text.
+            items = []
         if items:
             result["kind"] = "ndjson"
             result["items"] = items
     elif ext in {".csv", ".tsv"}:
         delim = "\t" if ext == ".tsv" else (opts.csv_delimiter or ",")
-        reader = csv.reader(text.splitlines(), delimiter=delim)
-        rows: list[list[str]] = []
-        for i, row in enumerate(reader):
-            if i >= opts.max_rows:
-                break
-            rows.append(row)
+        # Read lazily from the text so only max_rows rows are ever split;
+        # newline="" lets the csv module keep line breaks inside quoted fields.
+        reader = csv.reader(io.StringIO(text, newline=""), delimiter=delim)
+        rows: list[list[str]] = list(islice(reader, max(opts.max_rows, 0)))
         result["kind"] = "csv"
         result["delimiter"] = delim
         result["rows"] = rows
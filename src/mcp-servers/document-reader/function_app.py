@@ -15,6 +15,7 @@ import logging
 import os
 import sys
 import uuid
+from collections import OrderedDict
 from pathlib import Path
 
 import azure.functions as func
@@ -35,6 +36,27 @@ MCP_PROTOCOL_VERSION = os.environ.get("MCP_PROTOCOL_VERSION", "2025-06-18")
 
 WORKSPACE_ROOT = Path(__file__).resolve().parents[3]
 
+# Binary reads requested with return_blob_ref are held here, keyed by sha256,
+# and served from GET /blob/{digest} instead of inlined as base64.
+BLOB_CACHE_MAX_ENTRIES = 64
+BLOB_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_blob_cache: OrderedDict[str, tuple[str, bytes]] = OrderedDict()
+_blob_cache_bytes = 0
+
+
+def _cache_blob(digest: str, mime: str, data: bytes) -> None:
+    """Store a blob, evicting least-recently-used entries past the size limits."""
+    global _blob_cache_bytes
+    if digest in _blob_cache:
+        _blob_cache.move_to_end(digest)
+        return
+    _blob_cache[digest] = (mime, data)
+    _blob_cache_bytes += len(data)
+    while len(_blob_cache) > BLOB_CACHE_MAX_ENTRIES or _blob_cache_bytes > BLOB_CACHE_MAX_BYTES:
+        _, (_, evicted) = _blob_cache.popitem(last=False)
+        _blob_cache_bytes -= len(evicted)
+
 server = MCPServer(
     name="document-reader",
     version="0.1.0",
@@ -96,23 +118,38 @@ server = MCPServer(
                 "description": "If true, include a data: URL for binary results (useful for image_url).",
                 "default": False,
             },
+            "return_blob_ref": {
+                "type": "boolean",
+                "description": (
+                    "If true, binary results omit base64 and return blob_id instead; fetch the bytes with "
+                    "GET /blob/{blob_id}. Blobs are kept in a small in-memory cache, so fetch promptly."
+                ),
+                "default": False,
+            },
         },
         "required": ["path"],
     },
 )
 async def read_document_tool(args: dict) -> dict:
+    max_bytes = int(args.get("max_bytes", 4_000_000))
     opts = ReadOptions(
         mode=str(args.get("mode", "auto")),
         allow_outside_workspace=bool(args.get("allow_outside_workspace", False)),
-        max_bytes=int(args.get("max_bytes", 4_000_000)),
+        max_bytes=max_bytes,
         max_chars=int(args.get("max_chars", 200_000)),
         max_rows=int(args.get("max_rows", 500)),
         parse_structured=bool(args.get("parse_structured", True)),
         csv_delimiter=str(args.get("csv_delimiter", ",")),
         include_data_url=bool(args.get("include_data_url", False)),
+        # A blob larger than the whole cache could never be served; inline it instead.
+        encode_binary=not (args.get("return_blob_ref", False) and max_bytes <= BLOB_CACHE_MAX_BYTES),
     )
 
-    return read_document(str(args.get("path", "")), workspace_root=WORKSPACE_ROOT, options=opts)
+    result = read_document(str(args.get("path", "")), workspace_root=WORKSPACE_ROOT, options=opts)
+    if "data" in result:
+        _cache_blob(result["sha256"], result["mime"], result.pop("data"))
+        result["blob_id"] = result["sha256"]
+    return result
 
 
 discovery_handler, message_handler = create_function_app_handlers(server)
@@ -167,6 +204,30 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
     return await message_handler(req)
 
 
+@app.route(route="blob/{digest}", methods=["GET"])
+async def get_blob(req: func.HttpRequest) -> func.HttpResponse:
+    """Serve the raw bytes of a binary document read with return_blob_ref."""
+    digest = req.route_params.get("digest", "")
+    entry = _blob_cache.get(digest)
+    if entry is None:
+        return func.HttpResponse(
+            json.dumps({"ok": False, "error": "blob_not_found", "blob_id": digest}),
+            status_code=404,
+            mimetype="application/json",
+        )
+
+    _blob_cache.move_to_end(digest)
+    # Blobs are content-addressed, so the digest is a strong ETag and the
+    # bytes at a given URL never change; clients revalidate without a body.
+    etag = f'"{digest}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=3600, immutable"}
+    if etag in req.headers.get("If-None-Match", ""):
+        return func.HttpResponse(status_code=304, headers=headers)
+
+    mime, data = entry
+    return func.HttpResponse(body=data, mimetype=mime, headers=headers)
+
+
 @app.route(route="health", methods=["GET"])
 async def health_check(req: func.HttpRequest) -> func.HttpResponse:
     return func.HttpResponse(
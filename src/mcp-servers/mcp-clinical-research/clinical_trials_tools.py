@@ -3,12 +3,16 @@
 Migrated from standalone clinical-trials MCP server.
 """
 
-import json
+import asyncio
 import logging
 import os
+import time
+from functools import lru_cache
+from itertools import islice
 from typing import Optional
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +23,111 @@ logger = logging.getLogger(__name__)
 CT_API_BASE = "https://clinicaltrials.gov/api/v2"
 DEMO_MODE = os.environ.get("DEMO_MODE", "false").lower() in ("true", "1", "yes")
 
+# Shared read-only defaults for absent API modules, so formatters don't
+# allocate a fresh {} / [] per missing key. Never mutate these.
+_EMPTY: dict = {}
+_EMPTY_LIST: tuple = ()
+
+# Only the fields _format_trial_detail reads; the full record with results
+# is often hundreds of KB.
+DETAIL_FIELDS = (
+    "NCTId,BriefTitle,OfficialTitle,OverallStatus,StartDate,CompletionDate,"
+    "BriefSummary,DetailedDescription,StudyType,Phase,EnrollmentCount,Condition,"
+    "InterventionType,InterventionName,InterventionDescription,"
+    "EligibilityCriteria,Sex,MinimumAge,MaximumAge,HealthyVolunteers,"
+    "PrimaryOutcomeMeasure,PrimaryOutcomeTimeFrame,PrimaryOutcomeDescription,"
+    "LeadSponsorName,CollaboratorName,"
+    "CentralContactName,CentralContactRole,CentralContactPhone,CentralContactEMail"
+)
+
+# Per-endpoint query params never change, so build them once (httpx copies
+# params when encoding and never mutates the dict passed in).
+_DETAIL_PARAMS = {"fields": DETAIL_FIELDS}
+_LOCATION_PARAMS = {
+    "fields": (
+        "NCTId,BriefTitle,LocationFacility,LocationCity,LocationState,"
+        "LocationCountry,LocationStatus,LocationContactName,"
+        "LocationContactPhone,LocationContactEMail"
+    ),
+}
+_RESULTS_PARAMS = {
+    "fields": (
+        "NCTId,BriefTitle,OverallStatus,ResultsFirstPostDate,"
+        "PrimaryOutcomeMeasure,PrimaryOutcomeDescription,"
+        "OutcomeMeasureTitle,OutcomeMeasureType,"
+        "OutcomeMeasureDescription,OutcomeMeasureTimeFrame"
+    ),
+}
+
+# ---------------------------------------------------------------------------
+# Shared HTTP client (lazy-initialized)
+# ---------------------------------------------------------------------------
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get or create the pooled ClinicalTrials.gov client shared by all tools."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            base_url=CT_API_BASE,
+            http2=True,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=300),
+        )
+    return _http_client
+
+
+# ---------------------------------------------------------------------------
+# Response cache — study records change at most daily, so short-lived reuse
+# across MCP tool calls is safe.
+# ---------------------------------------------------------------------------
+
+RESPONSE_CACHE_TTL = 600.0  # seconds
+RESPONSE_CACHE_MAX_ENTRIES = 2048
+
+_response_cache: dict[tuple, tuple[float, Optional[dict]]] = {}
+_inflight: dict[tuple, asyncio.Future] = {}
+
+
+async def _fetch_json(key: tuple, path: str, params: Optional[dict]) -> Optional[dict]:
+    """Issue the GET, parse the body, and cache it. Returns None on 404."""
+    response = await get_http_client().get(path, params=params)
+    if response.status_code == 404:
+        data = None
+    else:
+        response.raise_for_status()
+        # Body is already buffered; orjson parses it several times faster than response.json()
+        data = orjson.loads(response.content)
+
+    _response_cache.pop(key, None)
+    if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+        del _response_cache[next(iter(_response_cache))]
+    _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL, data)
+    return data
+
+
+async def _cached_get(path: str, params: Optional[dict] = None) -> Optional[dict]:
+    """GET a ClinicalTrials.gov path through the TTL cache.
+
+    Concurrent calls for the same path and params share a single in-flight
+    request. Returns the parsed JSON body, or None if the API returned 404.
+    """
+    key = (path, tuple(sorted(params.items())) if params else ())
+    cached = _response_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1]
+
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_fetch_json(key, path, params))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one cancelled caller does not cancel the fetch for the others
+    return await asyncio.shield(future)
+
+
 # ---------------------------------------------------------------------------
 # Tool definitions
 # ---------------------------------------------------------------------------
@@ -168,24 +277,27 @@ TOOLS = [
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=4096)
+def _normalize_nct_id(nct_id: str) -> str:
+    """Canonical form of an NCT identifier (chat loops re-request the same IDs)."""
+    return nct_id.upper().strip()
+
+
 def _format_trial_summary(study: dict) -> dict:
     """Format a trial summary from search results."""
-    protocol = study.get("protocolSection", {})
-    id_module = protocol.get("identificationModule", {})
-    status_module = protocol.get("statusModule", {})
-    design = protocol.get("designModule", {})
-    conditions = protocol.get("conditionsModule", {})
-    interventions = protocol.get("armsInterventionsModule", {})
-    contacts = protocol.get("contactsLocationsModule", {})
-    sponsor = protocol.get("sponsorCollaboratorsModule", {})
-
-    locations = contacts.get("locations", [])
-    location_summary: list[str] = []
-    for loc in locations[:3]:
-        city = loc.get("city", "")
-        state = loc.get("state", "")
-        country = loc.get("country", "")
-        location_summary.append(f"{city}, {state}, {country}".strip(", "))
+    protocol = study.get("protocolSection", _EMPTY)
+    id_module = protocol.get("identificationModule", _EMPTY)
+    status_module = protocol.get("statusModule", _EMPTY)
+    design = protocol.get("designModule", _EMPTY)
+    conditions = protocol.get("conditionsModule", _EMPTY)
+    interventions = protocol.get("armsInterventionsModule", _EMPTY)
+    contacts = protocol.get("contactsLocationsModule", _EMPTY)
+    sponsor = protocol.get("sponsorCollaboratorsModule", _EMPTY)
+
+    location_summary = [
+        f"{loc.get('city', '')}, {loc.get('state', '')}, {loc.get('country', '')}".strip(", ")
+        for loc in contacts.get("locations", _EMPTY_LIST)[:3]
+    ]
 
     return {
         "nct_id": id_module.get("nctId"),
@@ -194,11 +306,10 @@ def _format_trial_summary(study: dict) -> dict:
         "phase": design.get("phases", ["N/A"]),
         "study_type": design.get("studyType"),
         "conditions": conditions.get("conditions", [])[:5],
-        "interventions": [
-            i.get("name") for i in interventions.get("interventions", [])
-        ][:5],
-        "enrollment": design.get("enrollmentInfo", {}).get("count"),
-        "sponsor": sponsor.get("leadSponsor", {}).get("name"),
+        # Slice before mapping so only the five kept entries are visited
+        "interventions": [i.get("name") for i in interventions.get("interventions", _EMPTY_LIST)[:5]],
+        "enrollment": design.get("enrollmentInfo", _EMPTY).get("count"),
+        "sponsor": sponsor.get("leadSponsor", _EMPTY).get("name"),
         "locations_preview": location_summary
         if location_summary
         else ["See trial for locations"],
@@ -207,31 +318,31 @@ def _format_trial_summary(study: dict) -> dict:
 
 def _format_trial_detail(data: dict) -> dict:
     """Format detailed trial information."""
-    protocol = data.get("protocolSection", {})
-
-    id_module = protocol.get("identificationModule", {})
-    status_module = protocol.get("statusModule", {})
-    desc_module = protocol.get("descriptionModule", {})
-    design = protocol.get("designModule", {})
-    eligibility = protocol.get("eligibilityModule", {})
-    outcomes = protocol.get("outcomesModule", {})
-    sponsor = protocol.get("sponsorCollaboratorsModule", {})
-    contacts = protocol.get("contactsLocationsModule", {})
-    conditions = protocol.get("conditionsModule", {})
-    interventions = protocol.get("armsInterventionsModule", {})
+    protocol = data.get("protocolSection", _EMPTY)
+
+    id_module = protocol.get("identificationModule", _EMPTY)
+    status_module = protocol.get("statusModule", _EMPTY)
+    desc_module = protocol.get("descriptionModule", _EMPTY)
+    design = protocol.get("designModule", _EMPTY)
+    eligibility = protocol.get("eligibilityModule", _EMPTY)
+    outcomes = protocol.get("outcomesModule", _EMPTY)
+    sponsor = protocol.get("sponsorCollaboratorsModule", _EMPTY)
+    contacts = protocol.get("contactsLocationsModule", _EMPTY)
+    conditions = protocol.get("conditionsModule", _EMPTY)
+    interventions = protocol.get("armsInterventionsModule", _EMPTY)
 
     return {
         "nct_id": id_module.get("nctId"),
         "title": id_module.get("briefTitle"),
         "official_title": id_module.get("officialTitle"),
         "status": status_module.get("overallStatus"),
-        "start_date": status_module.get("startDateStruct", {}).get("date"),
-        "completion_date": status_module.get("completionDateStruct", {}).get("date"),
+        "start_date": status_module.get("startDateStruct", _EMPTY).get("date"),
+        "completion_date": status_module.get("completionDateStruct", _EMPTY).get("date"),
         "description": desc_module.get("briefSummary"),
         "detailed_description": desc_module.get("detailedDescription"),
         "study_type": design.get("studyType"),
         "phase": design.get("phases", []),
-        "enrollment": design.get("enrollmentInfo", {}).get("count"),
+        "enrollment": design.get("enrollmentInfo", _EMPTY).get("count"),
         "conditions": conditions.get("conditions", []),
         "interventions": [
             {
@@ -239,7 +350,7 @@ def _format_trial_detail(data: dict) -> dict:
                 "name": i.get("name"),
                 "description": i.get("description"),
             }
-            for i in interventions.get("interventions", [])
+            for i in interventions.get("interventions", _EMPTY_LIST)
         ],
         "eligibility": {
             "criteria": eligibility.get("eligibilityCriteria"),
@@ -254,10 +365,10 @@ def _format_trial_detail(data: dict) -> dict:
                 "time_frame": o.get("timeFrame"),
                 "description": o.get("description"),
             }
-            for o in outcomes.get("primaryOutcomes", [])
+            for o in outcomes.get("primaryOutcomes", _EMPTY_LIST)
         ],
-        "sponsor": sponsor.get("leadSponsor", {}).get("name"),
-        "collaborators": [c.get("name") for c in sponsor.get("collaborators", [])],
+        "sponsor": sponsor.get("leadSponsor", _EMPTY).get("name"),
+        "collaborators": [c.get("name") for c in sponsor.get("collaborators", _EMPTY_LIST)],
         "central_contacts": [
             {
                 "name": c.get("name"),
@@ -265,13 +376,15 @@ def _format_trial_detail(data: dict) -> dict:
                 "phone": c.get("phone"),
                 "email": c.get("email"),
             }
-            for c in contacts.get("centralContacts", [])
+            for c in contacts.get("centralContacts", _EMPTY_LIST)
         ],
     }
 
 
 def _format_location(loc: dict) -> dict:
     """Format a trial location."""
+    contacts = loc.get("contacts")
+    contact = contacts[0] if contacts else _EMPTY
     return {
         "facility": loc.get("facility"),
         "city": loc.get("city"),
@@ -279,31 +392,19 @@ def _format_location(loc: dict) -> dict:
         "country": loc.get("country"),
         "status": loc.get("status"),
         "contact": {
-            "name": (
-                loc.get("contacts", [{}])[0].get("name")
-                if loc.get("contacts")
-                else None
-            ),
-            "phone": (
-                loc.get("contacts", [{}])[0].get("phone")
-                if loc.get("contacts")
-                else None
-            ),
-            "email": (
-                loc.get("contacts", [{}])[0].get("email")
-                if loc.get("contacts")
-                else None
-            ),
+            "name": contact.get("name"),
+            "phone": contact.get("phone"),
+            "email": contact.get("email"),
         },
     }
 
 
 def _extract_outcomes(protocol: dict, results: dict) -> list:
     """Extract primary outcome measures."""
-    outcomes_module = results.get("outcomeMeasuresModule", {})
-    outcome_measures = outcomes_module.get("outcomeMeasures", [])
+    outcomes_module = results.get("outcomeMeasuresModule", _EMPTY)
+    outcome_measures = outcomes_module.get("outcomeMeasures", _EMPTY_LIST)
 
-    primary = [o for o in outcome_measures if o.get("type") == "PRIMARY"]
+    primary = (o for o in outcome_measures if o.get("type") == "PRIMARY")
 
     return [
         {
@@ -311,7 +412,7 @@ def _extract_outcomes(protocol: dict, results: dict) -> list:
             "description": o.get("description"),
             "time_frame": o.get("timeFrame"),
         }
-        for o in primary[:5]
+        for o in islice(primary, 5)
     ]
 
 
@@ -406,17 +507,14 @@ async def search_by_condition(
         params["query.locn"] = location
         params["filter.geo"] = f"distance({distance_miles}mi)"
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{CT_API_BASE}/studies", params=params)
-        response.raise_for_status()
-        data = response.json()
+    data = await _cached_get("/studies", params=params) or {}
 
-        return {
-            "condition": condition,
-            "location": location,
-            "total_recruiting": data.get("totalCount", 0),
-            "trials": [_format_trial_summary(s) for s in data.get("studies", [])],
-        }
+    return {
+        "condition": condition,
+        "location": location,
+        "total_recruiting": data.get("totalCount", 0),
+        "trials": [_format_trial_summary(s) for s in data.get("studies", _EMPTY_LIST)],
+    }
 
 
 async def search_clinical_trials(
@@ -482,37 +580,29 @@ async def search_clinical_trials(
         "CompletionDate,EnrollmentCount,StudyType,LeadSponsorName"
     )
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{CT_API_BASE}/studies", params=params)
-        response.raise_for_status()
-        data = response.json()
+    data = await _cached_get("/studies", params=params) or {}
 
-        studies = data.get("studies", [])
+    studies = data.get("studies", _EMPTY_LIST)
 
-        return {
-            "total_count": data.get("totalCount", 0),
-            "returned_count": len(studies),
-            "trials": [_format_trial_summary(s) for s in studies],
-        }
+    return {
+        "total_count": data.get("totalCount", 0),
+        "returned_count": len(studies),
+        "trials": [_format_trial_summary(s) for s in studies],
+    }
 
 
 async def get_trial_details(nct_id: str) -> dict:
     """Get detailed trial information by NCT ID."""
-    nct_id = nct_id.upper().strip()
+    nct_id = _normalize_nct_id(nct_id)
 
     if DEMO_MODE:
         return _demo_trial_detail(nct_id)
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{CT_API_BASE}/studies/{nct_id}")
-
-        if response.status_code == 404:
-            return {"found": False, "nct_id": nct_id}
-
-        response.raise_for_status()
-        data = response.json()
+    data = await _cached_get(f"/studies/{nct_id}", params=_DETAIL_PARAMS)
+    if data is None:
+        return {"found": False, "nct_id": nct_id}
 
-        return {"found": True, "trial": _format_trial_detail(data)}
+    return {"found": True, "trial": _format_trial_detail(data)}
 
 
 async def get_trial_eligibility(nct_id: str) -> dict:
@@ -528,13 +618,13 @@ async def get_trial_eligibility(nct_id: str) -> dict:
         "nct_id": nct_id,
         "title": trial.get("title"),
         "eligibility": trial.get("eligibility", {}),
-        "healthy_volunteers": trial.get("eligibility", {}).get("healthy_volunteers"),
+        "healthy_volunteers": trial.get("eligibility", _EMPTY).get("healthy_volunteers"),
     }
 
 
 async def get_trial_locations(nct_id: str, status: Optional[str] = None) -> dict:
     """Get trial locations, optionally filtered by recruitment status."""
-    nct_id = nct_id.upper().strip()
+    nct_id = _normalize_nct_id(nct_id)
 
     if DEMO_MODE:
         return {
@@ -553,46 +643,31 @@ async def get_trial_locations(nct_id: str, status: Optional[str] = None) -> dict
             ],
         }
 
-    params = {
-        "fields": (
-            "NCTId,BriefTitle,LocationFacility,LocationCity,LocationState,"
-            "LocationCountry,LocationStatus,LocationContactName,"
-            "LocationContactPhone,LocationContactEMail"
-        ),
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{CT_API_BASE}/studies/{nct_id}", params=params
-        )
-
-        if response.status_code == 404:
-            return {"found": False, "nct_id": nct_id}
+    data = await _cached_get(f"/studies/{nct_id}", params=_LOCATION_PARAMS)
+    if data is None:
+        return {"found": False, "nct_id": nct_id}
 
-        response.raise_for_status()
-        data = response.json()
+    protocol = data.get("protocolSection", _EMPTY)
+    contacts_locations = protocol.get("contactsLocationsModule", _EMPTY)
+    locations = contacts_locations.get("locations", _EMPTY_LIST)
 
-        protocol = data.get("protocolSection", {})
-        contacts_locations = protocol.get("contactsLocationsModule", {})
-        locations = contacts_locations.get("locations", [])
-
-        # Optional status filter
-        if status:
-            locations = [
-                loc for loc in locations if loc.get("status") == status
-            ]
+    # Optional status filter
+    if status:
+        locations = [
+            loc for loc in locations if loc.get("status") == status
+        ]
 
-        return {
-            "nct_id": nct_id,
-            "title": protocol.get("identificationModule", {}).get("briefTitle"),
-            "location_count": len(locations),
-            "locations": [_format_location(loc) for loc in locations],
-        }
+    return {
+        "nct_id": nct_id,
+        "title": protocol.get("identificationModule", _EMPTY).get("briefTitle"),
+        "location_count": len(locations),
+        "locations": [_format_location(loc) for loc in locations],
+    }
 
 
 async def get_trial_results(nct_id: str) -> dict:
     """Get trial results if available."""
-    nct_id = nct_id.upper().strip()
+    nct_id = _normalize_nct_id(nct_id)
 
     if DEMO_MODE:
         return {
@@ -604,48 +679,30 @@ async def get_trial_results(nct_id: str) -> dict:
             "primary_outcomes": "Results not yet posted",
         }
 
-    params = {
-        "fields": (
-            "NCTId,BriefTitle,OverallStatus,ResultsFirstPostDate,"
-            "PrimaryOutcomeMeasure,PrimaryOutcomeDescription,"
-            "OutcomeMeasureTitle,OutcomeMeasureType"
-        ),
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{CT_API_BASE}/studies/{nct_id}", params=params
-        )
-
-        if response.status_code == 404:
-            return {"found": False, "nct_id": nct_id}
-
-        response.raise_for_status()
-        data = response.json()
+    data = await _cached_get(f"/studies/{nct_id}", params=_RESULTS_PARAMS)
+    if data is None:
+        return {"found": False, "nct_id": nct_id}
 
-        protocol = data.get("protocolSection", {})
-        results = data.get("resultsSection", {})
+    protocol = data.get("protocolSection", _EMPTY)
+    status_module = protocol.get("statusModule", _EMPTY)
+    results = data.get("resultsSection", _EMPTY)
 
-        has_results = bool(results)
+    has_results = bool(results)
 
-        return {
-            "nct_id": nct_id,
-            "title": protocol.get("identificationModule", {}).get("briefTitle"),
-            "status": protocol.get("statusModule", {}).get("overallStatus"),
-            "has_results": has_results,
-            "results_posted_date": (
-                protocol.get("statusModule", {})
-                .get("resultsFirstPostDateStruct", {})
-                .get("date")
-                if has_results
-                else None
-            ),
-            "primary_outcomes": (
-                _extract_outcomes(protocol, results)
-                if has_results
-                else "Results not yet posted"
-            ),
-        }
+    return {
+        "nct_id": nct_id,
+        "title": protocol.get("identificationModule", _EMPTY).get("briefTitle"),
+        "status": status_module.get("overallStatus"),
+        "has_results": has_results,
+        "results_posted_date": (
+            status_module.get("resultsFirstPostDateStruct", _EMPTY).get("date") if has_results else None
+        ),
+        "primary_outcomes": (
+            _extract_outcomes(protocol, results)
+            if has_results
+            else "Results not yet posted"
+        ),
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -10,12 +10,12 @@ Domains:
   - ClinicalTrials: Trial search, eligibility, locations, results (ClinicalTrials.gov API v2)
 """
 
-import json
 import logging
 import os
 import uuid
 
 import azure.functions as func
+import orjson
 
 from fhir_tools import HANDLERS as FHIR_HANDLERS
 from fhir_tools import TOOLS as FHIR_TOOLS
@@ -41,6 +41,39 @@ SERVER_DESCRIPTION = (
 ALL_TOOLS = FHIR_TOOLS + PUBMED_TOOLS + TRIALS_TOOLS
 ALL_HANDLERS = {**FHIR_HANDLERS, **PUBMED_HANDLERS, **TRIALS_HANDLERS}
 
+# The tool catalog is static, so serialize the discovery document and the
+# tools/list result once at import instead of on every request.
+_DISCOVERY_BODY = orjson.dumps(
+    {
+        "name": SERVER_NAME,
+        "version": SERVER_VERSION,
+        "description": SERVER_DESCRIPTION,
+        "protocol_version": MCP_PROTOCOL_VERSION,
+        "capabilities": {"tools": True, "resources": False, "prompts": False},
+        "tools": ALL_TOOLS,
+    }
+)
+_TOOLS_LIST_RESULT = orjson.dumps({"tools": ALL_TOOLS})
+_INITIALIZE_RESULT = {
+    "protocolVersion": MCP_PROTOCOL_VERSION,
+    "serverInfo": {"name": SERVER_NAME, "version": SERVER_VERSION},
+    "capabilities": {"tools": {"listChanged": False}},
+}
+
+# JSON-RPC error envelope; only the id and message vary per response
+_ERROR_TEMPLATE = b'{"jsonrpc":"2.0","id":%s,"error":{"code":%d,"message":%s}}'
+_PARSE_ERROR_BODY = _ERROR_TEMPLATE % (b"null", -32700, b'"Parse error"')
+_SSE_NOT_SUPPORTED_BODY = _ERROR_TEMPLATE % (
+    b"null",
+    -32600,
+    b'"SSE transport not supported. Use POST for Streamable HTTP transport."',
+)
+
+
+def _error_body(msg_id, code: int, message: str) -> bytes:
+    """Render a JSON-RPC error response from the pre-serialized envelope."""
+    return _ERROR_TEMPLATE % (orjson.dumps(msg_id), code, orjson.dumps(message))
+
 
 # ============================================================================
 # Azure Function Endpoints
@@ -51,16 +84,7 @@ ALL_HANDLERS = {**FHIR_HANDLERS, **PUBMED_HANDLERS, **TRIALS_HANDLERS}
 async def mcp_discovery(req: func.HttpRequest) -> func.HttpResponse:
     """MCP Discovery endpoint — returns server capabilities and all 20 tools."""
     return func.HttpResponse(
-        json.dumps(
-            {
-                "name": SERVER_NAME,
-                "version": SERVER_VERSION,
-                "description": SERVER_DESCRIPTION,
-                "protocol_version": MCP_PROTOCOL_VERSION,
-                "capabilities": {"tools": True, "resources": False, "prompts": False},
-                "tools": ALL_TOOLS,
-            }
-        ),
+        _DISCOVERY_BODY,
         mimetype="application/json",
         headers={"X-MCP-Protocol-Version": MCP_PROTOCOL_VERSION, "Cache-Control": "no-cache"},
     )
@@ -74,23 +98,14 @@ async def mcp_get(req: func.HttpRequest) -> func.HttpResponse:
     accept = req.headers.get("Accept", "")
     if "text/event-stream" in accept:
         return func.HttpResponse(
-            json.dumps(
-                {
-                    "jsonrpc": "2.0",
-                    "error": {
-                        "code": -32600,
-                        "message": "SSE transport not supported. Use POST for Streamable HTTP transport.",
-                    },
-                    "id": None,
-                }
-            ),
+            _SSE_NOT_SUPPORTED_BODY,
             status_code=405,
             mimetype="application/json",
             headers={"Allow": "POST", "X-MCP-Protocol-Version": MCP_PROTOCOL_VERSION, "Mcp-Session-Id": session_id},
         )
 
     return func.HttpResponse(
-        json.dumps(
+        orjson.dumps(
             {
                 "name": SERVER_NAME,
                 "version": SERVER_VERSION,
@@ -111,10 +126,10 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
     session_id = req.headers.get("Mcp-Session-Id", str(uuid.uuid4()))
 
     try:
-        body = req.get_json()
+        body = orjson.loads(req.get_body())
     except ValueError:
         return func.HttpResponse(
-            json.dumps({"jsonrpc": "2.0", "id": None, "error": {"code": -32700, "message": "Parse error"}}),
+            _PARSE_ERROR_BODY,
             status_code=400,
             mimetype="application/json",
         )
@@ -125,14 +140,18 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
 
     try:
         if method == "initialize":
-            result = {
-                "protocolVersion": MCP_PROTOCOL_VERSION,
-                "serverInfo": {"name": SERVER_NAME, "version": SERVER_VERSION},
-                "capabilities": {"tools": {"listChanged": False}},
-            }
+            result = _INITIALIZE_RESULT
 
         elif method == "tools/list":
-            result = {"tools": ALL_TOOLS}
+            return func.HttpResponse(
+                b'{"jsonrpc":"2.0","id":' + orjson.dumps(msg_id) + b',"result":' + _TOOLS_LIST_RESULT + b"}",
+                mimetype="application/json",
+                headers={
+                    "X-MCP-Protocol-Version": MCP_PROTOCOL_VERSION,
+                    "Mcp-Session-Id": session_id,
+                    "Cache-Control": "no-cache",
+                },
+            )
 
         elif method == "tools/call":
             tool_name = params.get("name")
@@ -141,36 +160,25 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
             handler = ALL_HANDLERS.get(tool_name)
             if not handler:
                 return func.HttpResponse(
-                    json.dumps(
-                        {
-                            "jsonrpc": "2.0",
-                            "id": msg_id,
-                            "error": {"code": -32602, "message": f"Unknown tool: {tool_name}"},
-                        }
-                    ),
+                    _error_body(msg_id, -32602, f"Unknown tool: {tool_name}"),
                     mimetype="application/json",
                 )
 
             tool_result = await handler(tool_args)
-            result = {"content": [{"type": "text", "text": json.dumps(tool_result)}]}
+            tool_text = orjson.dumps(tool_result, option=orjson.OPT_NON_STR_KEYS).decode()
+            result = {"content": [{"type": "text", "text": tool_text}]}
 
         elif method == "ping":
             result = {}
 
         else:
             return func.HttpResponse(
-                json.dumps(
-                    {
-                        "jsonrpc": "2.0",
-                        "id": msg_id,
-                        "error": {"code": -32601, "message": f"Method not found: {method}"},
-                    }
-                ),
+                _error_body(msg_id, -32601, f"Method not found: {method}"),
                 mimetype="application/json",
             )
 
         return func.HttpResponse(
-            json.dumps({"jsonrpc": "2.0", "id": msg_id, "result": result}),
+            orjson.dumps({"jsonrpc": "2.0", "id": msg_id, "result": result}),
             mimetype="application/json",
             headers={
                 "X-MCP-Protocol-Version": MCP_PROTOCOL_VERSION,
@@ -182,9 +190,7 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
     except Exception as e:
         logger.exception("Error handling MCP message")
         return func.HttpResponse(
-            json.dumps(
-                {"jsonrpc": "2.0", "id": msg_id, "error": {"code": -32603, "message": f"Internal error: {e!s}"}}
-            ),
+            _error_body(msg_id, -32603, f"Internal error: {e!s}"),
             status_code=500,
             mimetype="application/json",
             headers={"Mcp-Session-Id": session_id},
@@ -195,7 +201,7 @@ async def mcp_message(req: func.HttpRequest) -> func.HttpResponse:
 async def health_check(req: func.HttpRequest) -> func.HttpResponse:
     """Health check endpoint."""
     return func.HttpResponse(
-        json.dumps({
+        orjson.dumps({
             "status": "healthy",
             "server": SERVER_NAME,
             "version": SERVER_VERSION,
@@ -0,0 +1,34 @@
+"""
+Unit tests — run offline, no MCP servers or Azure resources required.
+
+MCP server modules live in hyphenated directories (src/mcp-servers/<server>/)
+and several share the name function_app.py, so they are loaded by path.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+WORKSPACE_ROOT = Path(__file__).resolve().parent.parent.parent
+MCP_SERVERS_ROOT = WORKSPACE_ROOT / "src" / "mcp-servers"
+
+
+def load_server_module(server: str, module: str, alias: str) -> ModuleType:
+    """Import src/mcp-servers/<server>/<module>.py under a unique module name.
+
+    The server directory is put on sys.path first so the module's sibling
+    imports (e.g. ``from document_reader import ...``) resolve.
+    """
+    if alias in sys.modules:
+        return sys.modules[alias]
+    server_dir = MCP_SERVERS_ROOT / server
+    if str(server_dir) not in sys.path:
+        sys.path.insert(0, str(server_dir))
+    spec = importlib.util.spec_from_file_location(alias, server_dir / f"{module}.py")
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[alias] = mod
+    spec.loader.exec_module(mod)
+    return mod
@@ -0,0 +1,114 @@
+"""
+ClinicalTrials.gov response cache — TTL expiry and shared in-flight requests.
+
+Run via:
+  pytest tests/unit/test_clinical_trials_cache.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from tests.unit import load_server_module
+
+ct = load_server_module("mcp-clinical-research", "clinical_trials_tools", "clinical_trials_tools")
+
+
+class _FakeApi:
+    """Counts GETs served through an httpx.MockTransport, optionally gated."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await self.release.wait()
+        if request.url.path.endswith("/NCT00000000"):
+            return httpx.Response(404)
+        return httpx.Response(200, json={"path": request.url.path, "call": self.calls})
+
+
+@pytest.fixture
+def api(monkeypatch: pytest.MonkeyPatch) -> _FakeApi:
+    fake = _FakeApi()
+    client = httpx.AsyncClient(base_url=ct.CT_API_BASE, transport=httpx.MockTransport(fake.handler))
+    monkeypatch.setattr(ct, "_http_client", client)
+    monkeypatch.setattr(ct, "_response_cache", {})
+    monkeypatch.setattr(ct, "_inflight", {})
+    return fake
+
+
+class TestCachedGet:
+    def test_repeat_call_is_served_from_cache(self, api: _FakeApi):
+        async def run():
+            first = await ct._cached_get("/studies", {"query.cond": "asthma", "pageSize": 10})
+            # Same params in a different order map to the same key
+            second = await ct._cached_get("/studies", {"pageSize": 10, "query.cond": "asthma"})
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second
+        assert api.calls == 1
+
+    def test_expired_entry_is_refetched(self, api: _FakeApi, monkeypatch: pytest.MonkeyPatch):
+        now = [1000.0]
+        monkeypatch.setattr(ct.time, "monotonic", lambda: now[0])
+
+        async def run():
+            await ct._cached_get("/studies/NCT01234567")
+            now[0] += ct.RESPONSE_CACHE_TTL - 1
+            await ct._cached_get("/studies/NCT01234567")
+            assert api.calls == 1
+            now[0] += 2
+            return await ct._cached_get("/studies/NCT01234567")
+
+        assert asyncio.run(run())["call"] == 2
+        assert api.calls == 2
+
+    def test_404_is_cached_as_none(self, api: _FakeApi):
+        async def run():
+            return [await ct._cached_get("/studies/NCT00000000") for _ in range(2)]
+
+        assert asyncio.run(run()) == [None, None]
+        assert api.calls == 1
+
+    def test_concurrent_callers_share_one_request(self, api: _FakeApi):
+        async def run():
+            api.release.clear()
+            tasks = [asyncio.ensure_future(ct._cached_get("/studies/NCT01234567")) for _ in range(5)]
+            await asyncio.sleep(0)
+            api.release.set()
+            return await asyncio.gather(*tasks)
+
+        results = asyncio.run(run())
+        assert api.calls == 1
+        assert all(r == results[0] for r in results)
+        assert ct._inflight == {}
+
+    def test_cancelled_caller_does_not_cancel_shared_fetch(self, api: _FakeApi):
+        async def run():
+            api.release.clear()
+            first = asyncio.ensure_future(ct._cached_get("/studies/NCT01234567"))
+            second = asyncio.ensure_future(ct._cached_get("/studies/NCT01234567"))
+            await asyncio.sleep(0)
+            first.cancel()
+            api.release.set()
+            return await second
+
+        assert asyncio.run(run())["call"] == 1
+        assert api.calls == 1
+
+    def test_cache_is_bounded(self, api: _FakeApi, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(ct, "RESPONSE_CACHE_MAX_ENTRIES", 2)
+
+        async def run():
+            for nct in ("NCT00000001", "NCT00000002", "NCT00000003"):
+                await ct._cached_get(f"/studies/{nct}")
+
+        asyncio.run(run())
+        assert [key[0] for key in ct._response_cache] == ["/studies/NCT00000002", "/studies/NCT00000003"]
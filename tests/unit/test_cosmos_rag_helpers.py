@@ -0,0 +1,125 @@
+"""
+Cosmos RAG MCP server helpers — chunking, index batching and argument validation unit tests.
+
+Run via:
+  pytest tests/unit/test_cosmos_rag_helpers.py -v
+"""
+
+from __future__ import annotations
+
+import random
+
+import orjson
+import pytest
+
+for _dep in ("azure.functions", "azure.cosmos", "azure.identity", "openai"):
+    pytest.importorskip(_dep)
+
+from tests.unit import load_server_module  # noqa: E402
+
+rag = load_server_module("cosmos-rag", "function_app", "cosmos_rag_function_app")
+
+
+def _reference_chunk_text(text: str, chunk_size: int, overlap: int) -> list[str]:
+    """The character-at-a-time splitter chunk_text replaced, kept as an oracle."""
+    if len(text) <= chunk_size:
+        return [text]
+    sentences = []
+    current = ""
+    for char in text:
+        current += char
+        if char in ".!?\n" and len(current.strip()) > 0:
+            sentences.append(current.strip())
+            current = ""
+    if current.strip():
+        sentences.append(current.strip())
+
+    chunks = []
+    current_chunk = ""
+    for sentence in sentences:
+        if len(current_chunk) + len(sentence) + 1 > chunk_size and current_chunk:
+            chunks.append(current_chunk.strip())
+            words = current_chunk.split()
+            overlap_text = ""
+            for word in reversed(words):
+                if len(overlap_text) + len(word) + 1 > overlap:
+                    break
+                overlap_text = word + " " + overlap_text
+            current_chunk = overlap_text.strip() + " " + sentence
+        else:
+            current_chunk = (current_chunk + " " + sentence).strip()
+    if current_chunk.strip():
+        chunks.append(current_chunk.strip())
+    return chunks
+
+
+class TestChunkText:
+    def test_short_text_is_one_chunk(self):
+        assert rag.chunk_text("Prior auth criteria.", chunk_size=100) == ["Prior auth criteria."]
+
+    def test_splits_at_sentence_boundaries_with_overlap(self):
+        text = "Alpha beta gamma. Delta epsilon zeta! Eta theta iota?\nKappa lambda mu"
+        chunks = rag.chunk_text(text, chunk_size=40, overlap=12)
+        assert chunks == [
+            "Alpha beta gamma. Delta epsilon zeta!",
+            "zeta! Eta theta iota? Kappa lambda mu",
+        ]
+
+    def test_blank_lines_are_not_sentences(self):
+        text = "First line.\n\n\n   \nSecond line." + " pad" * 10
+        assert rag.chunk_text(text, chunk_size=30, overlap=0) == [
+            "First line. Second line.",
+            "pad pad pad pad pad pad pad pad pad pad",
+        ]
+
+    @pytest.mark.parametrize("seed", range(25))
+    def test_matches_reference_splitter(self, seed: int):
+        rng = random.Random(seed)
+        alphabet = "abc de fgh  ..!?\n\n  "
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(50, 3000)))
+        chunk_size = rng.randint(20, 400)
+        overlap = rng.randint(0, chunk_size // 2)
+        assert rag.chunk_text(text, chunk_size, overlap) == _reference_chunk_text(text, chunk_size, overlap)
+
+
+def _chunk_item(i: int, chunk_size: int) -> dict:
+    return {
+        "id": f"doc-chunk-{i}",
+        "content": "x" * chunk_size,
+        "embedding": [0.0123456789012345] * 3072,
+        "chunkIndex": i,
+    }
+
+
+class TestIndexBatches:
+    def test_default_chunks_fill_batches_by_count(self):
+        items = [_chunk_item(i, rag.DEFAULT_CHUNK_SIZE) for i in range(60)]
+        batches = rag._index_batches(items)
+        assert [len(b) for b in batches] == [25, 25, 10]
+        assert [item for batch in batches for item in batch] == items
+
+    def test_large_chunks_stay_under_byte_limit(self):
+        items = [_chunk_item(i, 200_000) for i in range(30)]
+        batches = rag._index_batches(items)
+        assert [item for batch in batches for item in batch] == items
+        for batch in batches:
+            assert len(batch) <= rag.INDEX_BATCH_SIZE
+            assert sum(len(orjson.dumps(item)) for item in batch) <= rag.INDEX_BATCH_MAX_BYTES
+
+    def test_oversized_item_is_sent_alone(self):
+        items = [_chunk_item(0, 100), _chunk_item(1, rag.INDEX_BATCH_MAX_BYTES), _chunk_item(2, 100)]
+        assert [len(b) for b in rag._index_batches(items)] == [1, 1, 1]
+
+
+class TestIntArg:
+    def test_default_when_absent(self):
+        assert rag.int_arg({}, "limit", 5, 20) == 5
+
+    @pytest.mark.parametrize(("value", "expected"), [(7, 7), (0, 1), (-5, 1), (500, 20)])
+    def test_clamped_to_range(self, value: int, expected: int):
+        assert rag.int_arg({"limit": value}, "limit", 5, 20) == expected
+
+    @pytest.mark.parametrize("value", ["10", "1; DROP", 2.5, True, None, [3]])
+    def test_non_integer_is_invalid_params(self, value):
+        with pytest.raises(rag.InvalidParamsError, match="limit must be an integer"):
+            rag.int_arg({"limit": value}, "limit", 5, 20)
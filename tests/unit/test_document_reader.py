@@ -0,0 +1,146 @@
+"""
+Document Reader helpers — structured parsing and read cache unit tests.
+
+Run via:
+  pytest tests/unit/test_document_reader.py -v
+"""
+
+from __future__ import annotations
+
+import base64
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from tests.unit import load_server_module
+
+dr = load_server_module("document-reader", "document_reader", "document_reader")
+
+
+def _read(path: Path, **options) -> dict:
+    return dr.read_document(str(path), workspace_root=path.parent, options=dr.ReadOptions(**options))
+
+
+class TestCsv:
+    def test_quoted_newlines_stay_inside_the_field(self, tmp_path: Path):
+        path = tmp_path / "notes.csv"
+        path.write_text('id,note\n1,"line one\nline two"\n2,"a\r\nb"\n', newline="")
+        result = _read(path)
+        assert result["rows"] == [["id", "note"], ["1", "line one\nline two"], ["2", "a\r\nb"]]
+        assert result["truncated_rows"] is False
+
+    def test_max_rows_truncates(self, tmp_path: Path):
+        path = tmp_path / "codes.csv"
+        path.write_text("code\n" + "".join(f"{i}\n" for i in range(10)))
+        result = _read(path, max_rows=3)
+        assert result["rows"] == [["code"], ["0"], ["1"]]
+        assert result["truncated_rows"] is True
+
+    def test_tsv_uses_tab_delimiter(self, tmp_path: Path):
+        path = tmp_path / "codes.tsv"
+        path.write_text("code\tdesc\nE11.9\tType 2 diabetes\n")
+        assert _read(path)["rows"] == [["code", "desc"], ["E11.9", "Type 2 diabetes"]]
+
+    @pytest.mark.parametrize("max_rows", [0, -5])
+    def test_non_positive_max_rows_returns_no_rows(self, tmp_path: Path, max_rows: int):
+        path = tmp_path / "codes.csv"
+        path.write_text("code\nA\n")
+        result = _read(path, max_rows=max_rows)
+        assert result["ok"] is True
+        assert result["rows"] == []
+        assert result["truncated_rows"] is True
+
+
+@pytest.fixture
+def read_cache(monkeypatch: pytest.MonkeyPatch) -> OrderedDict:
+    cache: OrderedDict = OrderedDict()
+    monkeypatch.setattr(dr, "_read_cache", cache)
+    monkeypatch.setattr(dr, "_read_cache_bytes", 0)
+    return cache
+
+
+def _touch(path: Path, content: str, mtime_ns: int) -> None:
+    path.write_text(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestReadCache:
+    def test_unchanged_file_is_served_from_cache(self, tmp_path: Path, read_cache: OrderedDict):
+        path = tmp_path / "note.txt"
+        _touch(path, "first", 1_000_000_000)
+        first = _read(path)
+        first["text"] = "edited by caller"
+        assert _read(path)["text"] == "first"
+        assert len(read_cache) == 1
+
+    def test_changed_mtime_invalidates(self, tmp_path: Path, read_cache: OrderedDict):
+        path = tmp_path / "note.txt"
+        _touch(path, "alpha", 1_000_000_000)
+        _read(path)
+        _touch(path, "bravo", 2_000_000_000)  # same size, new mtime
+        assert _read(path)["text"] == "bravo"
+
+    def test_changed_size_invalidates(self, tmp_path: Path, read_cache: OrderedDict):
+        path = tmp_path / "note.txt"
+        _touch(path, "alpha", 1_000_000_000)
+        _read(path)
+        _touch(path, "alpha and more", 1_000_000_000)  # same mtime, new size
+        assert _read(path)["text"] == "alpha and more"
+
+    def test_different_options_are_cached_separately(self, tmp_path: Path, read_cache: OrderedDict):
+        path = tmp_path / "note.txt"
+        path.write_text("0123456789")
+        assert _read(path, max_chars=4)["text"] == "0123"
+        assert _read(path)["text"] == "0123456789"
+        assert len(read_cache) == 2
+
+    def test_cache_disabled_by_option(self, tmp_path: Path, read_cache: OrderedDict):
+        path = tmp_path / "note.txt"
+        path.write_text("x")
+        _read(path, cache=False)
+        assert not read_cache
+
+    def test_evicts_least_recently_used_past_entry_limit(
+        self, tmp_path: Path, read_cache: OrderedDict, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(dr, "READ_CACHE_MAX_ENTRIES", 2)
+        paths = []
+        for name in ("a", "b", "c"):
+            paths.append(tmp_path / f"{name}.txt")
+            paths[-1].write_text(name)
+        _read(paths[0])
+        _read(paths[1])
+        _read(paths[0])  # refreshes a
+        _read(paths[2])
+        assert [key[0] for key in read_cache] == [str(paths[0]), str(paths[2])]
+
+    def test_evicts_past_byte_limit(self, tmp_path: Path, read_cache: OrderedDict, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(dr, "READ_CACHE_MAX_BYTES", 1000)
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.txt").write_text(name * 300)
+            _read(tmp_path / f"{name}.txt")
+        assert [Path(key[0]).name for key in read_cache] == ["b.txt", "c.txt"]
+        assert dr._read_cache_bytes == sum(size for _, size in read_cache.values())
+
+    def test_charges_stored_base64_not_file_size(self, tmp_path: Path, read_cache: OrderedDict):
+        payload = bytes(range(256)) * 12
+        path = tmp_path / "scan.png"
+        path.write_bytes(payload)
+        result = _read(path, include_data_url=True)
+        [(_, charged)] = read_cache.values()
+        b64_len = len(base64.b64encode(payload))
+        assert len(result["base64"]) == b64_len
+        # base64 (4/3 of the file) plus the data_url that repeats it
+        assert charged >= 2 * b64_len
+        assert dr._read_cache_bytes == charged
+
+    def test_result_larger_than_budget_is_not_cached(
+        self, tmp_path: Path, read_cache: OrderedDict, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(dr, "READ_CACHE_MAX_BYTES", 1000)
+        path = tmp_path / "scan.png"
+        path.write_bytes(b"x" * 600)  # 800 chars of base64 + data_url
+        _read(path, include_data_url=True)
+        assert not read_cache
@@ -0,0 +1,104 @@
+"""
+Document Reader MCP server — blob cache eviction and GET /blob revalidation.
+
+Run via:
+  pytest tests/unit/test_document_reader_blobs.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+func = pytest.importorskip("azure.functions")
+
+from tests.unit import load_server_module  # noqa: E402
+
+app = load_server_module("document-reader", "function_app", "document_reader_function_app")
+
+
+def _user_function(route_fn):
+    """The coroutine behind an @app.route function.
+
+    Under the v2 programming model the decorator returns a FunctionBuilder.
+    """
+    build = getattr(route_fn, "build", None)
+    return build().get_user_function() if build is not None else route_fn
+
+
+def _get_blob(digest: str, headers: dict | None = None) -> func.HttpResponse:
+    req = func.HttpRequest(
+        method="GET",
+        url=f"/api/blob/{digest}",
+        headers=headers or {},
+        route_params={"digest": digest},
+        body=b"",
+    )
+    return asyncio.run(_user_function(app.get_blob)(req))
+
+
+@pytest.fixture(autouse=True)
+def empty_blob_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(app, "_blob_cache", OrderedDict())
+    monkeypatch.setattr(app, "_blob_cache_bytes", 0)
+
+
+class TestBlobCache:
+    def test_evicts_least_recently_used_past_entry_limit(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(app, "BLOB_CACHE_MAX_ENTRIES", 2)
+        app._cache_blob("a", "image/png", b"1")
+        app._cache_blob("b", "image/png", b"2")
+        app._cache_blob("a", "image/png", b"1")  # refreshes a
+        app._cache_blob("c", "image/png", b"3")
+        assert list(app._blob_cache) == ["a", "c"]
+        assert app._blob_cache_bytes == 2
+
+    def test_evicts_past_byte_limit(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(app, "BLOB_CACHE_MAX_BYTES", 10)
+        app._cache_blob("a", "application/pdf", b"x" * 4)
+        app._cache_blob("b", "application/pdf", b"x" * 4)
+        app._cache_blob("c", "application/pdf", b"x" * 4)
+        assert list(app._blob_cache) == ["b", "c"]
+        assert app._blob_cache_bytes == 8
+
+    def test_read_document_tool_returns_blob_ref(self, tmp_path: Path):
+        payload = b"%PDF-1.4 not really a pdf"
+        path = tmp_path / "scan.pdf"
+        path.write_bytes(payload)
+        result = asyncio.run(
+            app.read_document_tool({"path": str(path), "allow_outside_workspace": True, "return_blob_ref": True})
+        )
+        digest = hashlib.sha256(payload).hexdigest()
+        assert result["blob_id"] == digest
+        assert "base64" not in result and "data" not in result
+        assert app._blob_cache[digest] == ("application/pdf", payload)
+
+
+class TestGetBlob:
+    def test_serves_bytes_with_strong_etag(self):
+        app._cache_blob("abc", "image/png", b"PNGDATA")
+        resp = _get_blob("abc")
+        assert resp.status_code == 200
+        assert resp.get_body() == b"PNGDATA"
+        assert resp.headers["ETag"] == '"abc"'
+        assert "immutable" in resp.headers["Cache-Control"]
+
+    def test_matching_if_none_match_is_304_without_body(self):
+        app._cache_blob("abc", "image/png", b"PNGDATA")
+        resp = _get_blob("abc", {"If-None-Match": '"abc"'})
+        assert resp.status_code == 304
+        assert not resp.get_body()
+        assert resp.headers["ETag"] == '"abc"'
+
+    def test_stale_if_none_match_gets_body(self):
+        app._cache_blob("abc", "image/png", b"PNGDATA")
+        resp = _get_blob("abc", {"If-None-Match": '"other"'})
+        assert resp.status_code == 200
+        assert resp.get_body() == b"PNGDATA"
+
+    def test_unknown_digest_is_404(self):
+        assert _get_blob("missing").status_code == 404
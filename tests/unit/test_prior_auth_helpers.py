@@ -0,0 +1,166 @@
+"""
+Prior Authorization workflow helpers — parsing and resume unit tests.
+
+Run via:
+  pytest tests/unit/test_prior_auth_helpers.py -v
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import orjson
+import pytest
+
+pytest.importorskip("agent_framework")
+
+from src.agents.workflows.prior_auth import (
+    _atomic_write_bytes,
+    _check_compliance_gate,
+    _extract_json_from_text,
+    _read_raw_outputs,
+    _resume_raw_outputs,
+    run_prior_auth_decision_batch,
+)
+
+
+class TestExtractJsonFromText:
+    """Agent replies are mined for the first well-formed top-level object."""
+
+    def test_plain_json(self):
+        assert _extract_json_from_text('{"recommendation": "APPROVE"}') == {"recommendation": "APPROVE"}
+
+    def test_fenced_json(self):
+        text = 'Here you go:\n```json\n{"confidence_score": 85}\n```\nDone.'
+        assert _extract_json_from_text(text) == {"confidence_score": 85}
+
+    def test_object_embedded_in_prose(self):
+        text = 'Assessment follows {"a": {"b": 1}} and that is all.'
+        assert _extract_json_from_text(text) == {"a": {"b": 1}}
+
+    def test_no_object(self):
+        assert _extract_json_from_text("") is None
+        assert _extract_json_from_text("APPROVE with high confidence") is None
+
+    def test_trailing_comma_does_not_return_nested_object(self):
+        """A malformed reply must not yield one of its sub-objects."""
+        text = '{"recommendation": "APPROVE", "confidence_breakdown": {"a": 1}, "criteria": [1,2,],}'
+        assert _extract_json_from_text(text) is None
+
+    def test_malformed_object_in_prose_is_skipped_whole(self):
+        text = 'Draft: {"criteria": [1,], "breakdown": {"a": 1}} Final: {"recommendation": "PEND"}'
+        assert _extract_json_from_text(text) == {"recommendation": "PEND"}
+
+    def test_unclosed_object(self):
+        assert _extract_json_from_text('Result {"a": {"b": 1}') is None
+
+
+class TestCheckComplianceGate:
+    """The gate prefers parsed fields and only scans text when parsing failed."""
+
+    def test_parsed_proceed(self):
+        assert _check_compliance_gate({"can_proceed_to_clinical_review": True}, "") is True
+
+    def test_parsed_status_fail(self):
+        assert _check_compliance_gate({"compliance_status": "FAIL"}, "") is False
+
+    def test_parsed_fields_beat_text(self):
+        text = '{"can_proceed_to_clinical_review": true}'
+        assert _check_compliance_gate({"can_proceed_to_clinical_review": False}, text) is False
+
+    def test_text_fallback_when_unparsed(self):
+        text = 'Result: "compliance_status": "fail" because the NPI is missing'
+        assert _check_compliance_gate(None, text) is False
+
+    def test_text_fallback_when_fields_absent(self):
+        text = '"can_proceed_to_clinical_review" : TRUE'
+        assert _check_compliance_gate({"checklist": []}, text) is True
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '"compliance_status": "fail" ... "can_proceed_to_clinical_review": true',
+            '"can_proceed_to_clinical_review": false, "compliance_status": "PASS"',
+        ],
+    )
+    def test_text_fallback_any_proceed_signal_wins(self, text: str):
+        assert _check_compliance_gate(None, text) is True
+
+    def test_unreadable_defaults_to_proceed(self):
+        assert _check_compliance_gate(None, "no verdict here") is True
+
+
+def _raw_line(key: str, text: str) -> bytes:
+    return orjson.dumps({"bead": "bd-pa-001-intake", "key": key, "text": text}) + b"\n"
+
+
+class TestRawOutputsSideLog:
+    """raw_outputs.ndjson is read back on resume, tolerating a crash mid-append."""
+
+    def test_missing_file(self, tmp_path: Path):
+        assert _read_raw_outputs(tmp_path / "raw_outputs.ndjson") == {}
+
+    def test_later_lines_win(self, tmp_path: Path):
+        path = tmp_path / "raw_outputs.ndjson"
+        path.write_bytes(_raw_line("compliance", "first") + _raw_line("compliance", "second"))
+        assert _read_raw_outputs(path) == {"compliance": "second"}
+
+    def test_truncated_last_line_is_skipped(self, tmp_path: Path):
+        path = tmp_path / "raw_outputs.ndjson"
+        torn = _raw_line("concurrent", "clinical review")[:20]
+        path.write_bytes(_raw_line("compliance", "ok") + torn)
+        assert _read_raw_outputs(path) == {"compliance": "ok"}
+
+    def test_legacy_inline_texts_fill_gaps(self, tmp_path: Path):
+        """Waypoints from before the side log kept raw texts in assessment.json."""
+        path = tmp_path / "raw_outputs.ndjson"
+        existing = {"_raw_compliance": "legacy compliance", "_raw_concurrent": "legacy concurrent"}
+        assert _resume_raw_outputs(path, existing) == {
+            "compliance": "legacy compliance",
+            "concurrent": "legacy concurrent",
+        }
+
+    def test_side_log_takes_precedence_over_legacy(self, tmp_path: Path):
+        path = tmp_path / "raw_outputs.ndjson"
+        path.write_bytes(_raw_line("compliance", "from log"))
+        existing = {"_raw_compliance": "legacy", "_raw_concurrent": "legacy concurrent"}
+        assert _resume_raw_outputs(path, existing) == {
+            "compliance": "from log",
+            "concurrent": "legacy concurrent",
+        }
+
+
+class TestAtomicWrite:
+    def test_concurrent_writers_never_mix(self, tmp_path: Path):
+        path = tmp_path / "outputs" / "determination.json"
+        payloads = [bytes([65 + i]) * 50_000 for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda payload: _atomic_write_bytes(path, payload), payloads * 4))
+        assert path.read_bytes() in payloads
+        assert [p.name for p in path.parent.iterdir()] == ["determination.json"]
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path: Path):
+        path = tmp_path / "determination.json"
+        with pytest.raises(TypeError):
+            _atomic_write_bytes(path, "not bytes")  # type: ignore[arg-type]
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestDecisionBatchValidation:
+    """Concurrent decisions must each own a distinct, explicit run directory."""
+
+    @pytest.mark.parametrize("bad", [None, ""])
+    def test_rejects_implicit_run_directory(self, tmp_path: Path, bad):
+        with pytest.raises(ValueError, match="run directory path"):
+            asyncio.run(run_prior_auth_decision_batch([{}, {}], [str(tmp_path / "a"), bad]))
+
+    def test_rejects_duplicate_run_directory(self, tmp_path: Path):
+        dirs = [str(tmp_path / "run"), str(tmp_path / "other" / ".." / "run")]
+        with pytest.raises(ValueError, match="Duplicate run directory"):
+            asyncio.run(run_prior_auth_decision_batch([{}, {}], dirs))
+
+    def test_rejects_length_mismatch(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="same length"):
+            asyncio.run(run_prior_auth_decision_batch([{}], []))